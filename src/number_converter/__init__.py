@@ -1,15 +1,89 @@
 """Converting an integer to text in words."""
 
-__all__ = ['convert_number']
+__all__ = [
+    'aconvert_stream',
+    'convert_many',
+    'convert_number',
+    'convert_ordinal',
+    'dense_cache',
+    'paradigm',
+    'paradigm_many',
+    'persistent_cache',
+    'render',
+    'render_many',
+    'text_normalizer',
+]
 
 from functools import partial
 
-from .cases import FACTOR_CASES, NUMERAL_CASES
-from .converters import FactorConverter, NumberConverter
-from .main import convert_number_
+from .compiled import load_tables
+from .converters import (
+    TableFactorConverter,
+    TableNumberConverter,
+    TableOrdinalConverter,
+)
+from .dense import DenseCache
+from .main import convert_many_, convert_number_, convert_ordinal_
+from .normalizer import TextNormalizer
+from .paradigm import paradigm_, paradigm_many_
+from .persistent import PersistentCache
+from .stream import aconvert_stream_
+from .template import NumeralFormatter
+
+# The tables are loaded on first conversion, so the compiler
+# can regenerate them while the compiled module is outdated.
+load_ru_tables = partial(load_tables, 'ru')
+number_converter = TableNumberConverter(load_ru_tables)
+factor_converter = TableFactorConverter(load_ru_tables)
+ordinal_converter = TableOrdinalConverter(load_ru_tables)
 
 convert_number = partial(
     convert_number_,
-    number_converter=NumberConverter(NUMERAL_CASES),
-    factor_converter=FactorConverter(FACTOR_CASES),
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+convert_ordinal = partial(
+    convert_ordinal_,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+    ordinal_converter=ordinal_converter,
+)
+convert_many = partial(
+    convert_many_,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+aconvert_stream = partial(
+    aconvert_stream_,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+dense_cache = partial(
+    DenseCache,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
 )
+paradigm = partial(
+    paradigm_,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+paradigm_many = partial(
+    paradigm_many_,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+persistent_cache = partial(
+    PersistentCache,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+text_normalizer = partial(
+    TextNormalizer,
+    number_converter=number_converter,
+    factor_converter=factor_converter,
+)
+
+formatter = NumeralFormatter(number_converter, factor_converter)
+render = formatter.render
+render_many = formatter.render_many
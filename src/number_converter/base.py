@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from .types import CaseType, Factor, GenderType
+from .types import CASES, Case, CaseType, Factor, GenderType
 
 
 class NumberConverterABC(ABC):
@@ -38,3 +38,34 @@ class FactorConverterABC(ABC):
         factor: Factor,
     ) -> str:
         """Get the number factor numeral."""
+
+    def get_cases(self, number: int, factor: Factor) -> Case:
+        """Get the number factor numerals in all cases.
+
+        Each case is converted by `get_text`, the subclasses can
+        override it to share the declension between the cases.
+        """
+        return Case(*(self.get_text(number, case, factor) for case in CASES))
+
+
+class OrdinalConverterABC(ABC):
+    """The converter of integer to ordinal numeral."""
+
+    @abstractmethod
+    def get_text(
+        self,
+        number: int,
+        gender: GenderType,
+        case: CaseType,
+    ) -> str:
+        """Get ordinal numeral in the thousand factor."""
+
+    @abstractmethod
+    def get_factor_text(
+        self,
+        number: int,
+        gender: GenderType,
+        case: CaseType,
+        factor: Factor,
+    ) -> str:
+        """Get ordinal numeral of the round number factor."""
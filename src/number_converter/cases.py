@@ -1,6 +1,6 @@
 """Mapping of numbers to their text representations."""
 
-from .types import Case, CaseGroup, Factor, Gender
+from .types import Case, CaseGroup, Factor, Gender, LanguageData, Ordinal
 
 # fmt: off
 TENS_ENDINGS = Case(
@@ -180,3 +180,97 @@ FACTOR_CASES: dict[Factor, dict[CaseGroup, Case]] = {
         ),
     },
 }
+
+
+# The accusative of ordinals is inanimate.
+ORDINAL_ENDINGS = Case(
+    Gender('ый', 'ая', 'ое'),
+    Gender('ого', 'ой', 'ого'),
+    Gender('ому', 'ой', 'ому'),
+    Gender('ый', 'ую', 'ое'),
+    Gender('ым', 'ой', 'ым'),
+    Gender('ом', 'ой', 'ом'),
+)
+STRESSED_ORDINAL_ENDINGS = ORDINAL_ENDINGS._replace(
+    nominative=Gender('ой', 'ая', 'ое'),
+    accusative=Gender('ой', 'ую', 'ое'),
+)
+SOFT_ORDINAL_ENDINGS = Case(
+    Gender('ий', 'ья', 'ье'),
+    Gender('ьего', 'ьей', 'ьего'),
+    Gender('ьему', 'ьей', 'ьему'),
+    Gender('ий', 'ью', 'ье'),
+    Gender('ьим', 'ьей', 'ьим'),
+    Gender('ьем', 'ьей', 'ьем'),
+)
+
+ORDINAL_CASES: dict[int, Ordinal] = {
+    0: Ordinal('нулев', STRESSED_ORDINAL_ENDINGS),
+    1: Ordinal('перв', ORDINAL_ENDINGS),
+    2: Ordinal('втор', STRESSED_ORDINAL_ENDINGS),
+    3: Ordinal('трет', SOFT_ORDINAL_ENDINGS),
+    4: Ordinal('четвёрт', ORDINAL_ENDINGS),
+    5: Ordinal('пят', ORDINAL_ENDINGS),
+    6: Ordinal('шест', STRESSED_ORDINAL_ENDINGS),
+    7: Ordinal('седьм', STRESSED_ORDINAL_ENDINGS),
+    8: Ordinal('восьм', STRESSED_ORDINAL_ENDINGS),
+    9: Ordinal('девят', ORDINAL_ENDINGS),
+    10: Ordinal('десят', ORDINAL_ENDINGS),
+    11: Ordinal('одиннадцат', ORDINAL_ENDINGS),
+    12: Ordinal('двенадцат', ORDINAL_ENDINGS),
+    13: Ordinal('тринадцат', ORDINAL_ENDINGS),
+    14: Ordinal('четырнадцат', ORDINAL_ENDINGS),
+    15: Ordinal('пятнадцат', ORDINAL_ENDINGS),
+    16: Ordinal('шестнадцат', ORDINAL_ENDINGS),
+    17: Ordinal('семнадцат', ORDINAL_ENDINGS),
+    18: Ordinal('восемнадцат', ORDINAL_ENDINGS),
+    19: Ordinal('девятнадцат', ORDINAL_ENDINGS),
+    20: Ordinal('двадцат', ORDINAL_ENDINGS),
+    30: Ordinal('тридцат', ORDINAL_ENDINGS),
+    40: Ordinal('сороков', STRESSED_ORDINAL_ENDINGS),
+    50: Ordinal('пятидесят', ORDINAL_ENDINGS),
+    60: Ordinal('шестидесят', ORDINAL_ENDINGS),
+    70: Ordinal('семидесят', ORDINAL_ENDINGS),
+    80: Ordinal('восьмидесят', ORDINAL_ENDINGS),
+    90: Ordinal('девяност', ORDINAL_ENDINGS),
+    100: Ordinal('сот', ORDINAL_ENDINGS),
+    200: Ordinal('двухсот', ORDINAL_ENDINGS),
+    300: Ordinal('трёхсот', ORDINAL_ENDINGS),
+    400: Ordinal('четырёхсот', ORDINAL_ENDINGS),
+    500: Ordinal('пятисот', ORDINAL_ENDINGS),
+    600: Ordinal('шестисот', ORDINAL_ENDINGS),
+    700: Ordinal('семисот', ORDINAL_ENDINGS),
+    800: Ordinal('восьмисот', ORDINAL_ENDINGS),
+    900: Ordinal('девятисот', ORDINAL_ENDINGS),
+}
+
+ORDINAL_FACTORS: dict[Factor, Ordinal] = {
+    Factor.THOUSANDS: Ordinal('тысячн', ORDINAL_ENDINGS),
+    Factor.MILLIONS: Ordinal('миллионн', ORDINAL_ENDINGS),
+    Factor.BILLIONS: Ordinal('миллиардн', ORDINAL_ENDINGS),
+}
+
+# The round ordinal factors are fused with the genitive of the number
+# before them: двухтысячный, стапятидесятитысячный.
+# Numbers of the triad which are not in the genitive.
+FUSED_NUMERALS: dict[int, str] = {
+    1: 'одно',
+    90: 'девяносто',
+}
+# Whole triads which are not fused from numbers.
+FUSED_TRIADS: dict[int, str] = {
+    1: '',
+    100: 'сто',
+}
+
+
+RUSSIAN = LanguageData(
+    NUMERAL_CASES,
+    FACTOR_CASES,
+    TENS_ENDINGS,
+    HUNDREDS_ENDINGS,
+    ORDINAL_CASES,
+    ORDINAL_FACTORS,
+    FUSED_NUMERALS,
+    FUSED_TRIADS,
+)
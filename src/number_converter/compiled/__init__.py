@@ -0,0 +1,32 @@
+"""Numeral tables compiled from language data."""
+
+from importlib import import_module
+
+from ..types import Tables
+
+
+def load_tables(language: str) -> Tables:
+    """Get the compiled numeral tables of language.
+
+    Parameters
+    ----------
+    language : `str`
+        The language code, the name of compiled module.
+
+    Returns
+    -------
+    `Tables`
+        Flat lookup tables of numerals.
+
+    Raises
+    ------
+    ValueError
+        If the language has no compiled tables.
+
+    """
+    try:
+        module = import_module(f'.{language}', __name__)
+    except ModuleNotFoundError as e:
+        raise ValueError(f'Got unexpected language: {language}') from e
+
+    return module.TABLES  # type: ignore[no-any-return]
@@ -0,0 +1,2096 @@
+"""Numeral tables compiled from the ``ru`` language data.
+
+Generated by ``python -m src.number_converter.compiler``,
+do not edit.
+"""
+
+from ..types import Tables
+
+TABLES = Tables(
+    zero=(
+        'ноль',
+        'ноль',
+        'ноль',
+        'ноля',
+        'ноля',
+        'ноля',
+        'нолю',
+        'нолю',
+        'нолю',
+        'ноль',
+        'ноль',
+        'ноль',
+        'нолем',
+        'нолем',
+        'нолем',
+        'ноле',
+        'ноле',
+        'ноле',
+    ),
+    units=(
+        (
+            '',
+            'один',
+            'два',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одна',
+            'две',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одно',
+            'два',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одного',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одной',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одного',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одному',
+            'двум',
+            'трём',
+            'четырём',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одной',
+            'двум',
+            'трём',
+            'четырём',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одному',
+            'двум',
+            'трём',
+            'четырём',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'один',
+            'два',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одну',
+            'две',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одно',
+            'два',
+            'три',
+            'четыре',
+            'пять',
+            'шесть',
+            'семь',
+            'восемь',
+            'девять',
+        ),
+        (
+            '',
+            'одним',
+            'двумя',
+            'тремя',
+            'четырьмя',
+            'пятью',
+            'шестью',
+            'семью',
+            'восьмью',
+            'девятью',
+        ),
+        (
+            '',
+            'одной',
+            'двумя',
+            'тремя',
+            'четырьмя',
+            'пятью',
+            'шестью',
+            'семью',
+            'восьмью',
+            'девятью',
+        ),
+        (
+            '',
+            'одним',
+            'двумя',
+            'тремя',
+            'четырьмя',
+            'пятью',
+            'шестью',
+            'семью',
+            'восьмью',
+            'девятью',
+        ),
+        (
+            '',
+            'одном',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одной',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+        (
+            '',
+            'одном',
+            'двух',
+            'трёх',
+            'четырёх',
+            'пяти',
+            'шести',
+            'семи',
+            'восьми',
+            'девяти',
+        ),
+    ),
+    teens=(
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десять',
+            'одиннадцать',
+            'двенадцать',
+            'тринадцать',
+            'четырнадцать',
+            'пятнадцать',
+            'шестнадцать',
+            'семнадцать',
+            'восемнадцать',
+            'девятнадцать',
+        ),
+        (
+            'десятью',
+            'одиннадцатью',
+            'двенадцатью',
+            'тринадцатью',
+            'четырнадцатью',
+            'пятнадцатью',
+            'шестнадцатью',
+            'семнадцатью',
+            'восемнадцатью',
+            'девятнадцатью',
+        ),
+        (
+            'десятью',
+            'одиннадцатью',
+            'двенадцатью',
+            'тринадцатью',
+            'четырнадцатью',
+            'пятнадцатью',
+            'шестнадцатью',
+            'семнадцатью',
+            'восемнадцатью',
+            'девятнадцатью',
+        ),
+        (
+            'десятью',
+            'одиннадцатью',
+            'двенадцатью',
+            'тринадцатью',
+            'четырнадцатью',
+            'пятнадцатью',
+            'шестнадцатью',
+            'семнадцатью',
+            'восемнадцатью',
+            'девятнадцатью',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+        (
+            'десяти',
+            'одиннадцати',
+            'двенадцати',
+            'тринадцати',
+            'четырнадцати',
+            'пятнадцати',
+            'шестнадцати',
+            'семнадцати',
+            'восемнадцати',
+            'девятнадцати',
+        ),
+    ),
+    tens=(
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцать',
+            'тридцать',
+            'сорок',
+            'пятьдесят',
+            'шестьдесят',
+            'семьдесят',
+            'восемьдесят',
+            'девяносто',
+        ),
+        (
+            '',
+            '',
+            'двадцатью',
+            'тридцатью',
+            'сорока',
+            'пятьюдесятью',
+            'шестьюдесятью',
+            'семьюдесятью',
+            'восьмьюдесятью',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцатью',
+            'тридцатью',
+            'сорока',
+            'пятьюдесятью',
+            'шестьюдесятью',
+            'семьюдесятью',
+            'восьмьюдесятью',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцатью',
+            'тридцатью',
+            'сорока',
+            'пятьюдесятью',
+            'шестьюдесятью',
+            'семьюдесятью',
+            'восьмьюдесятью',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+        (
+            '',
+            '',
+            'двадцати',
+            'тридцати',
+            'сорока',
+            'пятидесяти',
+            'шестидесяти',
+            'семидесяти',
+            'восьмидесяти',
+            'девяноста',
+        ),
+    ),
+    hundreds=(
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'ста',
+            'двухсот',
+            'трёхсот',
+            'четырёхсот',
+            'пятисот',
+            'шестисот',
+            'семисот',
+            'восьмисот',
+            'девятисот',
+        ),
+        (
+            '',
+            'ста',
+            'двухсот',
+            'трёхсот',
+            'четырёхсот',
+            'пятисот',
+            'шестисот',
+            'семисот',
+            'восьмисот',
+            'девятисот',
+        ),
+        (
+            '',
+            'ста',
+            'двухсот',
+            'трёхсот',
+            'четырёхсот',
+            'пятисот',
+            'шестисот',
+            'семисот',
+            'восьмисот',
+            'девятисот',
+        ),
+        (
+            '',
+            'ста',
+            'двумстам',
+            'трёмстам',
+            'четырёмстам',
+            'пятистам',
+            'шестистам',
+            'семистам',
+            'восьмистам',
+            'девятистам',
+        ),
+        (
+            '',
+            'ста',
+            'двумстам',
+            'трёмстам',
+            'четырёмстам',
+            'пятистам',
+            'шестистам',
+            'семистам',
+            'восьмистам',
+            'девятистам',
+        ),
+        (
+            '',
+            'ста',
+            'двумстам',
+            'трёмстам',
+            'четырёмстам',
+            'пятистам',
+            'шестистам',
+            'семистам',
+            'восьмистам',
+            'девятистам',
+        ),
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'сто',
+            'двести',
+            'триста',
+            'четыреста',
+            'пятьсот',
+            'шестьсот',
+            'семьсот',
+            'восемьсот',
+            'девятьсот',
+        ),
+        (
+            '',
+            'ста',
+            'двумястами',
+            'тремястами',
+            'четырьмястами',
+            'пятьюстами',
+            'шестьюстами',
+            'семьюстами',
+            'восьмьюстами',
+            'девятьюстами',
+        ),
+        (
+            '',
+            'ста',
+            'двумястами',
+            'тремястами',
+            'четырьмястами',
+            'пятьюстами',
+            'шестьюстами',
+            'семьюстами',
+            'восьмьюстами',
+            'девятьюстами',
+        ),
+        (
+            '',
+            'ста',
+            'двумястами',
+            'тремястами',
+            'четырьмястами',
+            'пятьюстами',
+            'шестьюстами',
+            'семьюстами',
+            'восьмьюстами',
+            'девятьюстами',
+        ),
+        (
+            '',
+            'ста',
+            'двухстах',
+            'трёхсот',
+            'четырёхстах',
+            'пятистах',
+            'шестистах',
+            'семистах',
+            'восьмистах',
+            'девятистах',
+        ),
+        (
+            '',
+            'ста',
+            'двухстах',
+            'трёхсот',
+            'четырёхстах',
+            'пятистах',
+            'шестистах',
+            'семистах',
+            'восьмистах',
+            'девятистах',
+        ),
+        (
+            '',
+            'ста',
+            'двухстах',
+            'трёхсот',
+            'четырёхстах',
+            'пятистах',
+            'шестистах',
+            'семистах',
+            'восьмистах',
+            'девятистах',
+        ),
+    ),
+    factors=(
+        (
+            (
+                'тысяча',
+                'тысячи',
+                'тысяче',
+                'тысячу',
+                'тысячей',
+                'тысяче',
+            ),
+            (
+                'тысячи',
+                'тысяч',
+                'тысячам',
+                'тысячи',
+                'тысячами',
+                'тысячах',
+            ),
+            (
+                'тысяч',
+                'тысяч',
+                'тысячам',
+                'тысяч',
+                'тысячами',
+                'тысячах',
+            ),
+        ),
+        (
+            (
+                'миллион',
+                'миллиона',
+                'миллиону',
+                'миллион',
+                'миллионом',
+                'миллионе',
+            ),
+            (
+                'миллиона',
+                'миллионов',
+                'миллионам',
+                'миллиона',
+                'миллионами',
+                'миллионах',
+            ),
+            (
+                'миллионов',
+                'миллионов',
+                'миллионам',
+                'миллионов',
+                'миллионами',
+                'миллионах',
+            ),
+        ),
+        (
+            (
+                'миллиард',
+                'миллиарда',
+                'миллиарду',
+                'миллиард',
+                'миллиардом',
+                'миллиарде',
+            ),
+            (
+                'миллиарда',
+                'миллиардов',
+                'миллиардам',
+                'миллиарда',
+                'миллиардами',
+                'миллиардах',
+            ),
+            (
+                'миллиардов',
+                'миллиардов',
+                'миллиардам',
+                'миллиардов',
+                'миллиардами',
+                'миллиардах',
+            ),
+        ),
+    ),
+    case_groups=(
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+        2,
+        0,
+        1,
+        1,
+        1,
+        2,
+        2,
+        2,
+        2,
+        2,
+    ),
+    ordinal_zero=(
+        'нулевой',
+        'нулевая',
+        'нулевое',
+        'нулевого',
+        'нулевой',
+        'нулевого',
+        'нулевому',
+        'нулевой',
+        'нулевому',
+        'нулевой',
+        'нулевую',
+        'нулевое',
+        'нулевым',
+        'нулевой',
+        'нулевым',
+        'нулевом',
+        'нулевой',
+        'нулевом',
+    ),
+    ordinal_units=(
+        (
+            '',
+            'первый',
+            'второй',
+            'третий',
+            'четвёртый',
+            'пятый',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятый',
+        ),
+        (
+            '',
+            'первая',
+            'вторая',
+            'третья',
+            'четвёртая',
+            'пятая',
+            'шестая',
+            'седьмая',
+            'восьмая',
+            'девятая',
+        ),
+        (
+            '',
+            'первое',
+            'второе',
+            'третье',
+            'четвёртое',
+            'пятое',
+            'шестое',
+            'седьмое',
+            'восьмое',
+            'девятое',
+        ),
+        (
+            '',
+            'первого',
+            'второго',
+            'третьего',
+            'четвёртого',
+            'пятого',
+            'шестого',
+            'седьмого',
+            'восьмого',
+            'девятого',
+        ),
+        (
+            '',
+            'первой',
+            'второй',
+            'третьей',
+            'четвёртой',
+            'пятой',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятой',
+        ),
+        (
+            '',
+            'первого',
+            'второго',
+            'третьего',
+            'четвёртого',
+            'пятого',
+            'шестого',
+            'седьмого',
+            'восьмого',
+            'девятого',
+        ),
+        (
+            '',
+            'первому',
+            'второму',
+            'третьему',
+            'четвёртому',
+            'пятому',
+            'шестому',
+            'седьмому',
+            'восьмому',
+            'девятому',
+        ),
+        (
+            '',
+            'первой',
+            'второй',
+            'третьей',
+            'четвёртой',
+            'пятой',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятой',
+        ),
+        (
+            '',
+            'первому',
+            'второму',
+            'третьему',
+            'четвёртому',
+            'пятому',
+            'шестому',
+            'седьмому',
+            'восьмому',
+            'девятому',
+        ),
+        (
+            '',
+            'первый',
+            'второй',
+            'третий',
+            'четвёртый',
+            'пятый',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятый',
+        ),
+        (
+            '',
+            'первую',
+            'вторую',
+            'третью',
+            'четвёртую',
+            'пятую',
+            'шестую',
+            'седьмую',
+            'восьмую',
+            'девятую',
+        ),
+        (
+            '',
+            'первое',
+            'второе',
+            'третье',
+            'четвёртое',
+            'пятое',
+            'шестое',
+            'седьмое',
+            'восьмое',
+            'девятое',
+        ),
+        (
+            '',
+            'первым',
+            'вторым',
+            'третьим',
+            'четвёртым',
+            'пятым',
+            'шестым',
+            'седьмым',
+            'восьмым',
+            'девятым',
+        ),
+        (
+            '',
+            'первой',
+            'второй',
+            'третьей',
+            'четвёртой',
+            'пятой',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятой',
+        ),
+        (
+            '',
+            'первым',
+            'вторым',
+            'третьим',
+            'четвёртым',
+            'пятым',
+            'шестым',
+            'седьмым',
+            'восьмым',
+            'девятым',
+        ),
+        (
+            '',
+            'первом',
+            'втором',
+            'третьем',
+            'четвёртом',
+            'пятом',
+            'шестом',
+            'седьмом',
+            'восьмом',
+            'девятом',
+        ),
+        (
+            '',
+            'первой',
+            'второй',
+            'третьей',
+            'четвёртой',
+            'пятой',
+            'шестой',
+            'седьмой',
+            'восьмой',
+            'девятой',
+        ),
+        (
+            '',
+            'первом',
+            'втором',
+            'третьем',
+            'четвёртом',
+            'пятом',
+            'шестом',
+            'седьмом',
+            'восьмом',
+            'девятом',
+        ),
+    ),
+    ordinal_teens=(
+        (
+            'десятый',
+            'одиннадцатый',
+            'двенадцатый',
+            'тринадцатый',
+            'четырнадцатый',
+            'пятнадцатый',
+            'шестнадцатый',
+            'семнадцатый',
+            'восемнадцатый',
+            'девятнадцатый',
+        ),
+        (
+            'десятая',
+            'одиннадцатая',
+            'двенадцатая',
+            'тринадцатая',
+            'четырнадцатая',
+            'пятнадцатая',
+            'шестнадцатая',
+            'семнадцатая',
+            'восемнадцатая',
+            'девятнадцатая',
+        ),
+        (
+            'десятое',
+            'одиннадцатое',
+            'двенадцатое',
+            'тринадцатое',
+            'четырнадцатое',
+            'пятнадцатое',
+            'шестнадцатое',
+            'семнадцатое',
+            'восемнадцатое',
+            'девятнадцатое',
+        ),
+        (
+            'десятого',
+            'одиннадцатого',
+            'двенадцатого',
+            'тринадцатого',
+            'четырнадцатого',
+            'пятнадцатого',
+            'шестнадцатого',
+            'семнадцатого',
+            'восемнадцатого',
+            'девятнадцатого',
+        ),
+        (
+            'десятой',
+            'одиннадцатой',
+            'двенадцатой',
+            'тринадцатой',
+            'четырнадцатой',
+            'пятнадцатой',
+            'шестнадцатой',
+            'семнадцатой',
+            'восемнадцатой',
+            'девятнадцатой',
+        ),
+        (
+            'десятого',
+            'одиннадцатого',
+            'двенадцатого',
+            'тринадцатого',
+            'четырнадцатого',
+            'пятнадцатого',
+            'шестнадцатого',
+            'семнадцатого',
+            'восемнадцатого',
+            'девятнадцатого',
+        ),
+        (
+            'десятому',
+            'одиннадцатому',
+            'двенадцатому',
+            'тринадцатому',
+            'четырнадцатому',
+            'пятнадцатому',
+            'шестнадцатому',
+            'семнадцатому',
+            'восемнадцатому',
+            'девятнадцатому',
+        ),
+        (
+            'десятой',
+            'одиннадцатой',
+            'двенадцатой',
+            'тринадцатой',
+            'четырнадцатой',
+            'пятнадцатой',
+            'шестнадцатой',
+            'семнадцатой',
+            'восемнадцатой',
+            'девятнадцатой',
+        ),
+        (
+            'десятому',
+            'одиннадцатому',
+            'двенадцатому',
+            'тринадцатому',
+            'четырнадцатому',
+            'пятнадцатому',
+            'шестнадцатому',
+            'семнадцатому',
+            'восемнадцатому',
+            'девятнадцатому',
+        ),
+        (
+            'десятый',
+            'одиннадцатый',
+            'двенадцатый',
+            'тринадцатый',
+            'четырнадцатый',
+            'пятнадцатый',
+            'шестнадцатый',
+            'семнадцатый',
+            'восемнадцатый',
+            'девятнадцатый',
+        ),
+        (
+            'десятую',
+            'одиннадцатую',
+            'двенадцатую',
+            'тринадцатую',
+            'четырнадцатую',
+            'пятнадцатую',
+            'шестнадцатую',
+            'семнадцатую',
+            'восемнадцатую',
+            'девятнадцатую',
+        ),
+        (
+            'десятое',
+            'одиннадцатое',
+            'двенадцатое',
+            'тринадцатое',
+            'четырнадцатое',
+            'пятнадцатое',
+            'шестнадцатое',
+            'семнадцатое',
+            'восемнадцатое',
+            'девятнадцатое',
+        ),
+        (
+            'десятым',
+            'одиннадцатым',
+            'двенадцатым',
+            'тринадцатым',
+            'четырнадцатым',
+            'пятнадцатым',
+            'шестнадцатым',
+            'семнадцатым',
+            'восемнадцатым',
+            'девятнадцатым',
+        ),
+        (
+            'десятой',
+            'одиннадцатой',
+            'двенадцатой',
+            'тринадцатой',
+            'четырнадцатой',
+            'пятнадцатой',
+            'шестнадцатой',
+            'семнадцатой',
+            'восемнадцатой',
+            'девятнадцатой',
+        ),
+        (
+            'десятым',
+            'одиннадцатым',
+            'двенадцатым',
+            'тринадцатым',
+            'четырнадцатым',
+            'пятнадцатым',
+            'шестнадцатым',
+            'семнадцатым',
+            'восемнадцатым',
+            'девятнадцатым',
+        ),
+        (
+            'десятом',
+            'одиннадцатом',
+            'двенадцатом',
+            'тринадцатом',
+            'четырнадцатом',
+            'пятнадцатом',
+            'шестнадцатом',
+            'семнадцатом',
+            'восемнадцатом',
+            'девятнадцатом',
+        ),
+        (
+            'десятой',
+            'одиннадцатой',
+            'двенадцатой',
+            'тринадцатой',
+            'четырнадцатой',
+            'пятнадцатой',
+            'шестнадцатой',
+            'семнадцатой',
+            'восемнадцатой',
+            'девятнадцатой',
+        ),
+        (
+            'десятом',
+            'одиннадцатом',
+            'двенадцатом',
+            'тринадцатом',
+            'четырнадцатом',
+            'пятнадцатом',
+            'шестнадцатом',
+            'семнадцатом',
+            'восемнадцатом',
+            'девятнадцатом',
+        ),
+    ),
+    ordinal_tens=(
+        (
+            '',
+            '',
+            'двадцатый',
+            'тридцатый',
+            'сороковой',
+            'пятидесятый',
+            'шестидесятый',
+            'семидесятый',
+            'восьмидесятый',
+            'девяностый',
+        ),
+        (
+            '',
+            '',
+            'двадцатая',
+            'тридцатая',
+            'сороковая',
+            'пятидесятая',
+            'шестидесятая',
+            'семидесятая',
+            'восьмидесятая',
+            'девяностая',
+        ),
+        (
+            '',
+            '',
+            'двадцатое',
+            'тридцатое',
+            'сороковое',
+            'пятидесятое',
+            'шестидесятое',
+            'семидесятое',
+            'восьмидесятое',
+            'девяностое',
+        ),
+        (
+            '',
+            '',
+            'двадцатого',
+            'тридцатого',
+            'сорокового',
+            'пятидесятого',
+            'шестидесятого',
+            'семидесятого',
+            'восьмидесятого',
+            'девяностого',
+        ),
+        (
+            '',
+            '',
+            'двадцатой',
+            'тридцатой',
+            'сороковой',
+            'пятидесятой',
+            'шестидесятой',
+            'семидесятой',
+            'восьмидесятой',
+            'девяностой',
+        ),
+        (
+            '',
+            '',
+            'двадцатого',
+            'тридцатого',
+            'сорокового',
+            'пятидесятого',
+            'шестидесятого',
+            'семидесятого',
+            'восьмидесятого',
+            'девяностого',
+        ),
+        (
+            '',
+            '',
+            'двадцатому',
+            'тридцатому',
+            'сороковому',
+            'пятидесятому',
+            'шестидесятому',
+            'семидесятому',
+            'восьмидесятому',
+            'девяностому',
+        ),
+        (
+            '',
+            '',
+            'двадцатой',
+            'тридцатой',
+            'сороковой',
+            'пятидесятой',
+            'шестидесятой',
+            'семидесятой',
+            'восьмидесятой',
+            'девяностой',
+        ),
+        (
+            '',
+            '',
+            'двадцатому',
+            'тридцатому',
+            'сороковому',
+            'пятидесятому',
+            'шестидесятому',
+            'семидесятому',
+            'восьмидесятому',
+            'девяностому',
+        ),
+        (
+            '',
+            '',
+            'двадцатый',
+            'тридцатый',
+            'сороковой',
+            'пятидесятый',
+            'шестидесятый',
+            'семидесятый',
+            'восьмидесятый',
+            'девяностый',
+        ),
+        (
+            '',
+            '',
+            'двадцатую',
+            'тридцатую',
+            'сороковую',
+            'пятидесятую',
+            'шестидесятую',
+            'семидесятую',
+            'восьмидесятую',
+            'девяностую',
+        ),
+        (
+            '',
+            '',
+            'двадцатое',
+            'тридцатое',
+            'сороковое',
+            'пятидесятое',
+            'шестидесятое',
+            'семидесятое',
+            'восьмидесятое',
+            'девяностое',
+        ),
+        (
+            '',
+            '',
+            'двадцатым',
+            'тридцатым',
+            'сороковым',
+            'пятидесятым',
+            'шестидесятым',
+            'семидесятым',
+            'восьмидесятым',
+            'девяностым',
+        ),
+        (
+            '',
+            '',
+            'двадцатой',
+            'тридцатой',
+            'сороковой',
+            'пятидесятой',
+            'шестидесятой',
+            'семидесятой',
+            'восьмидесятой',
+            'девяностой',
+        ),
+        (
+            '',
+            '',
+            'двадцатым',
+            'тридцатым',
+            'сороковым',
+            'пятидесятым',
+            'шестидесятым',
+            'семидесятым',
+            'восьмидесятым',
+            'девяностым',
+        ),
+        (
+            '',
+            '',
+            'двадцатом',
+            'тридцатом',
+            'сороковом',
+            'пятидесятом',
+            'шестидесятом',
+            'семидесятом',
+            'восьмидесятом',
+            'девяностом',
+        ),
+        (
+            '',
+            '',
+            'двадцатой',
+            'тридцатой',
+            'сороковой',
+            'пятидесятой',
+            'шестидесятой',
+            'семидесятой',
+            'восьмидесятой',
+            'девяностой',
+        ),
+        (
+            '',
+            '',
+            'двадцатом',
+            'тридцатом',
+            'сороковом',
+            'пятидесятом',
+            'шестидесятом',
+            'семидесятом',
+            'восьмидесятом',
+            'девяностом',
+        ),
+    ),
+    ordinal_hundreds=(
+        (
+            '',
+            'сотый',
+            'двухсотый',
+            'трёхсотый',
+            'четырёхсотый',
+            'пятисотый',
+            'шестисотый',
+            'семисотый',
+            'восьмисотый',
+            'девятисотый',
+        ),
+        (
+            '',
+            'сотая',
+            'двухсотая',
+            'трёхсотая',
+            'четырёхсотая',
+            'пятисотая',
+            'шестисотая',
+            'семисотая',
+            'восьмисотая',
+            'девятисотая',
+        ),
+        (
+            '',
+            'сотое',
+            'двухсотое',
+            'трёхсотое',
+            'четырёхсотое',
+            'пятисотое',
+            'шестисотое',
+            'семисотое',
+            'восьмисотое',
+            'девятисотое',
+        ),
+        (
+            '',
+            'сотого',
+            'двухсотого',
+            'трёхсотого',
+            'четырёхсотого',
+            'пятисотого',
+            'шестисотого',
+            'семисотого',
+            'восьмисотого',
+            'девятисотого',
+        ),
+        (
+            '',
+            'сотой',
+            'двухсотой',
+            'трёхсотой',
+            'четырёхсотой',
+            'пятисотой',
+            'шестисотой',
+            'семисотой',
+            'восьмисотой',
+            'девятисотой',
+        ),
+        (
+            '',
+            'сотого',
+            'двухсотого',
+            'трёхсотого',
+            'четырёхсотого',
+            'пятисотого',
+            'шестисотого',
+            'семисотого',
+            'восьмисотого',
+            'девятисотого',
+        ),
+        (
+            '',
+            'сотому',
+            'двухсотому',
+            'трёхсотому',
+            'четырёхсотому',
+            'пятисотому',
+            'шестисотому',
+            'семисотому',
+            'восьмисотому',
+            'девятисотому',
+        ),
+        (
+            '',
+            'сотой',
+            'двухсотой',
+            'трёхсотой',
+            'четырёхсотой',
+            'пятисотой',
+            'шестисотой',
+            'семисотой',
+            'восьмисотой',
+            'девятисотой',
+        ),
+        (
+            '',
+            'сотому',
+            'двухсотому',
+            'трёхсотому',
+            'четырёхсотому',
+            'пятисотому',
+            'шестисотому',
+            'семисотому',
+            'восьмисотому',
+            'девятисотому',
+        ),
+        (
+            '',
+            'сотый',
+            'двухсотый',
+            'трёхсотый',
+            'четырёхсотый',
+            'пятисотый',
+            'шестисотый',
+            'семисотый',
+            'восьмисотый',
+            'девятисотый',
+        ),
+        (
+            '',
+            'сотую',
+            'двухсотую',
+            'трёхсотую',
+            'четырёхсотую',
+            'пятисотую',
+            'шестисотую',
+            'семисотую',
+            'восьмисотую',
+            'девятисотую',
+        ),
+        (
+            '',
+            'сотое',
+            'двухсотое',
+            'трёхсотое',
+            'четырёхсотое',
+            'пятисотое',
+            'шестисотое',
+            'семисотое',
+            'восьмисотое',
+            'девятисотое',
+        ),
+        (
+            '',
+            'сотым',
+            'двухсотым',
+            'трёхсотым',
+            'четырёхсотым',
+            'пятисотым',
+            'шестисотым',
+            'семисотым',
+            'восьмисотым',
+            'девятисотым',
+        ),
+        (
+            '',
+            'сотой',
+            'двухсотой',
+            'трёхсотой',
+            'четырёхсотой',
+            'пятисотой',
+            'шестисотой',
+            'семисотой',
+            'восьмисотой',
+            'девятисотой',
+        ),
+        (
+            '',
+            'сотым',
+            'двухсотым',
+            'трёхсотым',
+            'четырёхсотым',
+            'пятисотым',
+            'шестисотым',
+            'семисотым',
+            'восьмисотым',
+            'девятисотым',
+        ),
+        (
+            '',
+            'сотом',
+            'двухсотом',
+            'трёхсотом',
+            'четырёхсотом',
+            'пятисотом',
+            'шестисотом',
+            'семисотом',
+            'восьмисотом',
+            'девятисотом',
+        ),
+        (
+            '',
+            'сотой',
+            'двухсотой',
+            'трёхсотой',
+            'четырёхсотой',
+            'пятисотой',
+            'шестисотой',
+            'семисотой',
+            'восьмисотой',
+            'девятисотой',
+        ),
+        (
+            '',
+            'сотом',
+            'двухсотом',
+            'трёхсотом',
+            'четырёхсотом',
+            'пятисотом',
+            'шестисотом',
+            'семисотом',
+            'восьмисотом',
+            'девятисотом',
+        ),
+    ),
+    ordinal_factors=(
+        (
+            'тысячный',
+            'тысячная',
+            'тысячное',
+            'тысячного',
+            'тысячной',
+            'тысячного',
+            'тысячному',
+            'тысячной',
+            'тысячному',
+            'тысячный',
+            'тысячную',
+            'тысячное',
+            'тысячным',
+            'тысячной',
+            'тысячным',
+            'тысячном',
+            'тысячной',
+            'тысячном',
+        ),
+        (
+            'миллионный',
+            'миллионная',
+            'миллионное',
+            'миллионного',
+            'миллионной',
+            'миллионного',
+            'миллионному',
+            'миллионной',
+            'миллионному',
+            'миллионный',
+            'миллионную',
+            'миллионное',
+            'миллионным',
+            'миллионной',
+            'миллионным',
+            'миллионном',
+            'миллионной',
+            'миллионном',
+        ),
+        (
+            'миллиардный',
+            'миллиардная',
+            'миллиардное',
+            'миллиардного',
+            'миллиардной',
+            'миллиардного',
+            'миллиардному',
+            'миллиардной',
+            'миллиардному',
+            'миллиардный',
+            'миллиардную',
+            'миллиардное',
+            'миллиардным',
+            'миллиардной',
+            'миллиардным',
+            'миллиардном',
+            'миллиардной',
+            'миллиардном',
+        ),
+    ),
+    fused_units=(
+        '',
+        'одно',
+        'двух',
+        'трёх',
+        'четырёх',
+        'пяти',
+        'шести',
+        'семи',
+        'восьми',
+        'девяти',
+    ),
+    fused_teens=(
+        'десяти',
+        'одиннадцати',
+        'двенадцати',
+        'тринадцати',
+        'четырнадцати',
+        'пятнадцати',
+        'шестнадцати',
+        'семнадцати',
+        'восемнадцати',
+        'девятнадцати',
+    ),
+    fused_tens=(
+        '',
+        '',
+        'двадцати',
+        'тридцати',
+        'сорока',
+        'пятидесяти',
+        'шестидесяти',
+        'семидесяти',
+        'восьмидесяти',
+        'девяносто',
+    ),
+    fused_hundreds=(
+        '',
+        'ста',
+        'двухсот',
+        'трёхсот',
+        'четырёхсот',
+        'пятисот',
+        'шестисот',
+        'семисот',
+        'восьмисот',
+        'девятисот',
+    ),
+    fused_triads=(
+        (
+            1,
+            '',
+        ),
+        (
+            100,
+            'сто',
+        ),
+    ),
+)
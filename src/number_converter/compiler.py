@@ -0,0 +1,269 @@
+"""Compiling of language data into flat numeral tables.
+
+Regenerate the compiled modules::
+
+    python -m src.number_converter.compiler
+
+Check the compiled modules are up to date::
+
+    python -m src.number_converter.compiler --check
+
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from .cases import RUSSIAN
+from .converters import TABLE_FACTORS, FactorConverter, NumberConverter
+from .types import (
+    CASES,
+    FORMS,
+    GENDERS,
+    CaseGroup,
+    CaseType,
+    GenderType,
+    LanguageData,
+    Ordinal,
+    Tables,
+)
+
+LANGUAGES: dict[str, LanguageData] = {
+    'ru': RUSSIAN,
+}
+"""Language data by the language code."""
+
+COMPILED_DIR = Path(__file__).parent / 'compiled'
+INDENT = ' ' * 4
+
+Table = str | int | tuple['Table', ...]
+
+
+def compile_tables(language: LanguageData) -> Tables:
+    """Compile the language data into flat lookup tables.
+
+    The tables are filled by the data-driven converters,
+    so the compiled numerals are the same.
+
+    Parameters
+    ----------
+    language : `LanguageData`
+        Declarative numeral data of a language.
+
+    Returns
+    -------
+    `Tables`
+        Flat lookup tables of numerals.
+
+    """
+    number_converter = NumberConverter(
+        language.numeral_cases,
+        language.tens_endings,
+        language.hundreds_endings,
+    )
+    factor_converter = FactorConverter(language.factor_cases)
+
+    def get_digits(factor: int, start: int) -> tuple[tuple[str, ...], ...]:
+        return tuple(
+            ('',) * start
+            + tuple(
+                number_converter.get_text(digit * factor, gender, case)
+                for digit in range(start, 10)
+            )
+            for gender, case in FORMS
+        )
+
+    def get_ordinals(factor: int, start: int) -> tuple[tuple[str, ...], ...]:
+        return tuple(
+            ('',) * start
+            + tuple(
+                _decline(language.ordinal_cases[digit * factor], gender, case)
+                for digit in range(start, 10)
+            )
+            for gender, case in FORMS
+        )
+
+    def get_fused(factor: int, start: int) -> tuple[str, ...]:
+        # The fused numerals are in the genitive except the listed.
+        return ('',) * start + tuple(
+            language.fused_numerals.get(digit * factor)
+            or number_converter.get_text(digit * factor, 'M', 'G')
+            for digit in range(start, 10)
+        )
+
+    case_groups = list(CaseGroup)
+    # The first number of each case group determines its declension.
+    group_numbers = [
+        next(n for n in range(1, 100) if CaseGroup.from_number(n) is group)
+        for group in case_groups
+    ]
+
+    return Tables(
+        zero=tuple(
+            number_converter.get_numeral(0, gender, case)
+            for gender, case in FORMS
+        ),
+        units=get_digits(1, 1),
+        teens=tuple(
+            tuple(
+                number_converter.get_text(10 + digit, gender, case)
+                for digit in range(10)
+            )
+            for gender, case in FORMS
+        ),
+        tens=get_digits(10, 2),
+        hundreds=get_digits(100, 1),
+        factors=tuple(
+            tuple(
+                tuple(
+                    factor_converter.get_text(number, case, factor)
+                    for case in CASES
+                )
+                for number in group_numbers
+            )
+            for factor in TABLE_FACTORS
+        ),
+        case_groups=tuple(
+            case_groups.index(CaseGroup.from_number(number))
+            for number in range(100)
+        ),
+        ordinal_zero=tuple(
+            _decline(language.ordinal_cases[0], gender, case)
+            for gender, case in FORMS
+        ),
+        ordinal_units=get_ordinals(1, 1),
+        ordinal_teens=tuple(
+            tuple(
+                _decline(language.ordinal_cases[10 + digit], gender, case)
+                for digit in range(10)
+            )
+            for gender, case in FORMS
+        ),
+        ordinal_tens=get_ordinals(10, 2),
+        ordinal_hundreds=get_ordinals(100, 1),
+        ordinal_factors=tuple(
+            tuple(
+                _decline(language.ordinal_factors[factor], gender, case)
+                for gender, case in FORMS
+            )
+            for factor in TABLE_FACTORS
+        ),
+        fused_units=get_fused(1, 1),
+        fused_teens=tuple(
+            language.fused_numerals.get(10 + digit)
+            or number_converter.get_text(10 + digit, 'M', 'G')
+            for digit in range(10)
+        ),
+        fused_tens=get_fused(10, 2),
+        fused_hundreds=get_fused(100, 1),
+        fused_triads=tuple(sorted(language.fused_triads.items())),
+    )
+
+
+def _decline(ordinal: Ordinal, gender: GenderType, case: CaseType) -> str:
+    """Get the ordinal numeral in the gender and case."""
+    endings = getattr(ordinal.endings, CASES[case])
+    return f'{ordinal.stem}{getattr(endings, GENDERS[gender])}'
+
+
+def render_module(code: str, tables: Tables) -> str:
+    """Render the source code of compiled tables module.
+
+    Parameters
+    ----------
+    code : `str`
+        The language code.
+    tables : `Tables`
+        Flat lookup tables of numerals.
+
+    Returns
+    -------
+    `str`
+        The source code in the repository code style.
+
+    """
+    lines = [
+        f'"""Numeral tables compiled from the ``{code}`` language data.',
+        '',
+        'Generated by ``python -m src.number_converter.compiler``,',
+        'do not edit.',
+        '"""',
+        '',
+        'from ..types import Tables',
+        '',
+        'TABLES = Tables(',
+    ]
+    for name, value in tables._asdict().items():
+        lines.append(f'{INDENT}{name}={_render_value(value, 1)},')
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+def _render_value(value: Table, depth: int) -> str:
+    """Render the table value as a literal, an item per line."""
+    if not isinstance(value, tuple):
+        return repr(value)
+
+    indent = INDENT * (depth + 1)
+    items = ''.join(
+        f'{indent}{_render_value(item, depth + 1)},\n' for item in value
+    )
+    return f'(\n{items}{INDENT * depth})'
+
+
+def get_module_path(code: str) -> Path:
+    """Get the path of compiled tables module."""
+    return COMPILED_DIR / f'{code}.py'
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Compile the language tables.
+
+    Parameters
+    ----------
+    argv : `Sequence[str] | None`
+        Command line arguments, the process arguments by default.
+
+    Returns
+    -------
+    `int`
+        Exit status, 1 if the check found outdated modules.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        'languages',
+        nargs='*',
+        help=f'language codes {[*LANGUAGES]}, all by default',
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='check the compiled modules are up to date',
+    )
+    args = parser.parse_args(argv)
+
+    if unknown := set(args.languages) - set(LANGUAGES):
+        parser.error(f'Got unexpected languages: {sorted(unknown)}')
+
+    outdated: list[Path] = []
+
+    for code in args.languages or LANGUAGES:
+        path = get_module_path(code)
+        source = render_module(code, compile_tables(LANGUAGES[code]))
+
+        if args.check:
+            if not path.exists() or path.read_text('utf-8') != source:
+                outdated.append(path)
+        else:
+            path.write_text(source, 'utf-8')
+
+    for path in outdated:
+        print(f'Outdated compiled tables: {path}', file=sys.stderr)
+
+    return 1 if outdated else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
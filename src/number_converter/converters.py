@@ -1,11 +1,18 @@
 """Numeral converters."""
 
+from collections.abc import Callable
+from functools import cached_property
 from typing import override
 
-from .base import FactorConverterABC, NumberConverterABC
+from .base import (
+    FactorConverterABC,
+    NumberConverterABC,
+    OrdinalConverterABC,
+)
 from .cases import HUNDREDS_ENDINGS, TENS_ENDINGS
 from .types import (
     CASES,
+    FORMS,
     GENDERS,
     Case,
     CaseGroup,
@@ -13,9 +20,15 @@ from .types import (
     Factor,
     Gender,
     GenderType,
+    Tables,
 )
 
 LAST_DIGIT_DIVISOR = 10
+TABLE_FACTORS = (Factor.THOUSANDS, Factor.MILLIONS, Factor.BILLIONS)
+"""Factors in the order of compiled tables."""
+CASE_INDEX: dict[CaseType, int] = {
+    case: index for index, case in enumerate(CASES)
+}
 
 
 class NumberConverter(NumberConverterABC):
@@ -26,12 +39,23 @@ class NumberConverter(NumberConverterABC):
     numeral_cases : `dict[int, Case]`
         Mapping of numbers with their string representation,
         which has a special declension.
+    tens_endings : `Case`
+        Endings of the tens created via grammatical rule.
+    hundreds_endings : `Case`
+        Endings of the hundreds created via grammatical rule.
 
     """
 
-    def __init__(self, numeral_cases: dict[int, Case]) -> None:
+    def __init__(
+        self,
+        numeral_cases: dict[int, Case],
+        tens_endings: Case = TENS_ENDINGS,
+        hundreds_endings: Case = HUNDREDS_ENDINGS,
+    ) -> None:
         """Construct the converter."""
         self._numeral_cases = numeral_cases
+        self._tens_endings = tens_endings
+        self._hundreds_endings = hundreds_endings
 
     @override
     def get_numeral(
@@ -140,7 +164,7 @@ class NumberConverter(NumberConverterABC):
             # via grammatical rule.
             else:
                 numeral_base = self.get_numeral(hundreds_base, gender, case)
-                numeral_ending = getattr(HUNDREDS_ENDINGS, CASES[case])
+                numeral_ending = getattr(self._hundreds_endings, CASES[case])
                 numerals.append(numeral_base + str(numeral_ending))
 
         # The tens are converted separately.
@@ -161,7 +185,7 @@ class NumberConverter(NumberConverterABC):
                 # The tens 50, ..., 80 are created dynamically
                 # via grammatical rule.
                 numeral_base = self.get_numeral(tens_base, gender, case)
-                numeral_ending = getattr(TENS_ENDINGS, CASES[case])
+                numeral_ending = getattr(self._tens_endings, CASES[case])
                 numerals.append(numeral_base + str(numeral_ending))
 
         # The units are converted separately.
@@ -218,6 +242,417 @@ class FactorConverter(FactorConverterABC):
         'тысяче'
 
         """
-        case_group = CaseGroup.from_number(number)
-        cases = self._factor_cases[factor][case_group]
+        cases = self.get_cases(number, factor)
         return getattr(cases, CASES[case])  # type: ignore[no-any-return]
+
+    @override
+    def get_cases(self, number: int, factor: Factor) -> Case:
+        """Get the numerals for number factor in all cases.
+
+        The case group of the factor is determined once,
+        so the declension can be shared between the cases.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that comes before the factor.
+            Determines the declination of the factor.
+        factor: `Factor`
+            The factor to convert.
+
+        Returns
+        -------
+        `Case`
+            Numerals of the factor in each grammatical case.
+
+        Example
+        -------
+        >>> from .cases import FACTOR_CASES
+        >>> from .types import Factor
+        >>> converter = FactorConverter(FACTOR_CASES)
+        >>> converter.get_cases(2, Factor(1_000)).genitive
+        'тысяч'
+
+        """
+        case_group = CaseGroup.from_number(number)
+        return self._factor_cases[factor][case_group]
+
+
+class TablesLoader:
+    """The holder of compiled tables loaded on first use.
+
+    Parameters
+    ----------
+    tables : `Tables | Callable[[], Tables]`
+        Flat lookup tables of numerals compiled from language data,
+        or a callable loading them.
+
+    """
+
+    def __init__(self, tables: Tables | Callable[[], Tables]) -> None:
+        """Construct the holder."""
+        self._source = tables
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the holder for workers without loaded tables."""
+        return {'_source': self._source}
+
+    @cached_property
+    def _tables(self) -> Tables:
+        """Get the tables, load them on first use."""
+        if isinstance(self._source, Tables):
+            return self._source
+        return self._source()
+
+
+class TableNumberConverter(TablesLoader, NumberConverterABC):
+    """The converter of integer to numeral by compiled tables.
+
+    Parameters
+    ----------
+    tables : `Tables | Callable[[], Tables]`
+        Flat lookup tables of numerals compiled from language data,
+        or a callable loading them on first use.
+
+    """
+
+    @override
+    def get_numeral(
+        self,
+        case_number: int,
+        gender: GenderType,
+        case: CaseType,
+    ) -> str:
+        """Get a text representation of number with special declension.
+
+        Parameters
+        ----------
+        case_number : `int`
+            A number of single digit, teen, round ten or hundred.
+        gender : `GenderType`
+            An abbreviation that determines the gender of a declension.
+        case : `CaseType`
+            An abbreviation that determines the case of a declension.
+
+        Returns
+        -------
+        `str`
+            Numeral. The textual representation of the number.
+
+        Raises
+        ------
+        ValueError
+            If case number has no a single numeral.
+
+        Example
+        -------
+        >>> from .compiled import load_tables
+        >>> converter = TableNumberConverter(load_tables('ru'))
+        >>> converter.get_numeral(700, 'M', 'I')
+        'семьюстами'
+
+        """
+        form = FORMS[gender, case]
+
+        if case_number == 0:
+            return self._tables.zero[form]
+        if 0 < case_number < Factor.TENS:
+            return self._tables.units[form][case_number]
+        if Factor.TENS <= case_number < 2 * Factor.TENS:
+            return self._tables.teens[form][case_number - Factor.TENS]
+        if 0 < case_number < Factor.HUNDREDS and not case_number % 10:
+            return self._tables.tens[form][case_number // Factor.TENS]
+        if 0 < case_number < Factor.THOUSANDS and not case_number % 100:
+            return self._tables.hundreds[form][case_number // Factor.HUNDREDS]
+
+        raise ValueError(f'Got unexpected case number: {case_number}')
+
+    @override
+    def get_text(
+        self,
+        number: int,
+        gender: GenderType,
+        case: CaseType,
+    ) -> str:
+        """Get numeral in the thousand factor.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that will be converted into a numeral.
+        gender : `GenderType`
+            Grammatical gender of a numeral.
+        case : `CaseType`
+            Case of the numeral.
+
+        Returns
+        -------
+        `str`
+            The string representation of integer.
+
+        Raises
+        ------
+        ValueError
+            If the number is not between 1 and 999.
+
+        Example
+        -------
+        >>> from .compiled import load_tables
+        >>> converter = TableNumberConverter(load_tables('ru'))
+        >>> converter.get_text(122, 'N', 'I')
+        'ста двадцатью двумя'
+
+        """
+        if not (0 < number <= 999):
+            raise ValueError(f'Number must be between 1 and 999, got {number}')
+
+        form = FORMS[gender, case]
+        hundreds, rest = divmod(number, Factor.HUNDREDS)
+        tens, units = divmod(rest, Factor.TENS)
+        numerals: list[str] = []
+
+        if hundreds:
+            numerals.append(self._tables.hundreds[form][hundreds])
+
+        if tens == 1:
+            numerals.append(self._tables.teens[form][units])
+            return ' '.join(numerals)
+
+        if tens:
+            numerals.append(self._tables.tens[form][tens])
+        if units:
+            numerals.append(self._tables.units[form][units])
+
+        return ' '.join(numerals)
+
+
+class TableFactorConverter(TablesLoader, FactorConverterABC):
+    """The converter of number factor to numeral by compiled tables.
+
+    Parameters
+    ----------
+    tables : `Tables | Callable[[], Tables]`
+        Flat lookup tables of numerals compiled from language data,
+        or a callable loading them on first use.
+
+    """
+
+    @cached_property
+    def _case_groups(self) -> tuple[int, ...]:
+        """Get the case groups by the last two digits."""
+        return self._tables.case_groups
+
+    @cached_property
+    def _factors(self) -> dict[Factor, tuple[tuple[str, ...], ...]]:
+        """Get the factor names by the factor."""
+        return dict(zip(TABLE_FACTORS, self._tables.factors, strict=True))
+
+    @override
+    def get_text(self, number: int, case: CaseType, factor: Factor) -> str:
+        """Get the numeral for number factor.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that comes before the factor.
+            Determines the declination of the factor.
+        case : `CaseType`
+            Grammatical case for the factor.
+        factor: `Factor`
+            The factor to convert.
+
+        Returns
+        -------
+        `str`
+            Numeral. The textual representation of the factor.
+
+        Example
+        -------
+        >>> from .compiled import load_tables
+        >>> from .types import Factor
+        >>> converter = TableFactorConverter(load_tables('ru'))
+        >>> converter.get_text(12, 'I', Factor(1_000_000))
+        'миллионами'
+
+        """
+        case_group = self._case_groups[number % Factor.HUNDREDS]
+        return self._factors[factor][case_group][CASE_INDEX[case]]
+
+    @override
+    def get_cases(self, number: int, factor: Factor) -> Case:
+        """Get the numerals for number factor in all cases.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that comes before the factor.
+            Determines the declination of the factor.
+        factor: `Factor`
+            The factor to convert.
+
+        Returns
+        -------
+        `Case`
+            Numerals of the factor in each grammatical case.
+
+        """
+        case_group = self._case_groups[number % Factor.HUNDREDS]
+        return Case(*self._factors[factor][case_group])
+
+
+class TableOrdinalConverter(TablesLoader, OrdinalConverterABC):
+    """The converter of integer to ordinal numeral by compiled tables.
+
+    Only the last numeral is ordinal, the preceding ones
+    are cardinal in the nominative.
+
+    Parameters
+    ----------
+    tables : `Tables | Callable[[], Tables]`
+        Flat lookup tables of numerals compiled from language data,
+        or a callable loading them on first use.
+
+    """
+
+    _nominative = FORMS[Factor.UNITS.gender, 'N']
+
+    @cached_property
+    def _factors(self) -> dict[Factor, tuple[str, ...]]:
+        """Get the ordinal factor names by the factor."""
+        factors = self._tables.ordinal_factors
+        return dict(zip(TABLE_FACTORS, factors, strict=True))
+
+    @cached_property
+    def _fused_triads(self) -> dict[int, str]:
+        """Get the whole triads which are not fused from numbers."""
+        return dict(self._tables.fused_triads)
+
+    @override
+    def get_text(
+        self,
+        number: int,
+        gender: GenderType,
+        case: CaseType,
+    ) -> str:
+        """Get ordinal numeral in the thousand factor.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that will be converted into a numeral.
+        gender : `GenderType`
+            Grammatical gender of a numeral.
+        case : `CaseType`
+            Case of the numeral.
+
+        Returns
+        -------
+        `str`
+            The ordinal numeral, zero is converted too.
+
+        Raises
+        ------
+        ValueError
+            If the number is not between 0 and 999.
+
+        Example
+        -------
+        >>> from .compiled import load_tables
+        >>> converter = TableOrdinalConverter(load_tables('ru'))
+        >>> converter.get_text(121, 'M', 'G')
+        'сто двадцать первого'
+        >>> converter.get_text(300, 'F', 'P')
+        'трёхсотой'
+
+        """
+        if not (0 <= number <= 999):
+            raise ValueError(f'Number must be between 0 and 999, got {number}')
+
+        tables = self._tables
+        form = FORMS[gender, case]
+
+        if number == 0:
+            return tables.ordinal_zero[form]
+
+        hundreds, rest = divmod(number, Factor.HUNDREDS)
+        tens, units = divmod(rest, Factor.TENS)
+
+        if not rest:
+            return tables.ordinal_hundreds[form][hundreds]
+
+        numerals: list[str] = []
+        if hundreds:
+            numerals.append(tables.hundreds[self._nominative][hundreds])
+
+        if tens == 1:
+            numerals.append(tables.ordinal_teens[form][units])
+        elif not units:
+            numerals.append(tables.ordinal_tens[form][tens])
+        else:
+            if tens:
+                numerals.append(tables.tens[self._nominative][tens])
+            numerals.append(tables.ordinal_units[form][units])
+
+        return ' '.join(numerals)
+
+    @override
+    def get_factor_text(
+        self,
+        number: int,
+        gender: GenderType,
+        case: CaseType,
+        factor: Factor,
+    ) -> str:
+        """Get ordinal numeral of the round number factor.
+
+        The number before the factor is fused with it.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that comes before the factor.
+        gender : `GenderType`
+            Grammatical gender of a numeral.
+        case : `CaseType`
+            Case of the numeral.
+        factor: `Factor`
+            The factor to convert.
+
+        Returns
+        -------
+        `str`
+            The fused ordinal numeral.
+
+        Example
+        -------
+        >>> from .compiled import load_tables
+        >>> from .types import Factor
+        >>> converter = TableOrdinalConverter(load_tables('ru'))
+        >>> converter.get_factor_text(2, 'N', 'P', Factor(1_000))
+        'двухтысячном'
+        >>> converter.get_factor_text(21, 'M', 'N', Factor(1_000_000))
+        'двадцатиодномиллионный'
+
+        """
+        ordinal = self._factors[factor][FORMS[gender, case]]
+        return self._get_fused(number) + ordinal
+
+    def _get_fused(self, number: int) -> str:
+        """Get the prefix of the number fused with the factor."""
+        try:
+            return self._fused_triads[number]
+        except KeyError:
+            pass
+
+        tables = self._tables
+        hundreds, rest = divmod(number, Factor.HUNDREDS)
+        tens, units = divmod(rest, Factor.TENS)
+
+        if tens == 1:
+            return tables.fused_hundreds[hundreds] + tables.fused_teens[units]
+
+        return (
+            tables.fused_hundreds[hundreds]
+            + tables.fused_tens[tens]
+            + tables.fused_units[units]
+        )
@@ -1,6 +1,12 @@
 """Converting an integer to numeral."""
 
-from .base import FactorConverterABC, NumberConverterABC
+from collections.abc import Iterable
+
+from .base import (
+    FactorConverterABC,
+    NumberConverterABC,
+    OrdinalConverterABC,
+)
 from .types import CaseType, Factor, GenderType
 
 MAX_NUMBER = 999_999_999_999
@@ -20,6 +26,36 @@ def validate_number(number: int) -> None:
         )
 
 
+def split_number(number: int) -> list[tuple[int, Factor]]:
+    """Split the number into thousand triads with their factors.
+
+    Triads equal to zero are skipped, the rest are ordered
+    from the highest factor to the lowest.
+
+    Example
+    -------
+    >>> split_number(2_000_031)
+    [(2, <Factor.MILLIONS: 1000000>), (31, <Factor.UNITS: 1>)]
+
+    """
+    triads: list[tuple[int, Factor]] = []
+    remaining = number
+    factor_exponent = 0
+
+    while remaining:
+        number_part = remaining % Factor.THOUSANDS
+        remaining //= Factor.THOUSANDS
+
+        if number_part:
+            factor = Factor(Factor.THOUSANDS**factor_exponent)
+            triads.append((number_part, factor))
+
+        factor_exponent += 1
+
+    triads.reverse()
+    return triads
+
+
 def convert_number_(
     number: int,
     gender: GenderType,
@@ -63,31 +99,135 @@ def convert_number_(
     if number == 0:
         return number_converter.get_numeral(0, gender, case)
 
-    remaining = number
-    number_part_gender = gender
-    factor_exponent = 0
     parts: list[str] = []
 
-    while remaining:
-        number_part = remaining % Factor.THOUSANDS
-        remaining //= Factor.THOUSANDS
-        factor = Factor(Factor.THOUSANDS**factor_exponent)
+    for number_part, factor in split_number(number):
+        if factor is Factor.UNITS:
+            parts.append(number_converter.get_text(number_part, gender, case))
+            continue
+
+        # The factor determines the gender of a part of a number.
+        parts.append(
+            number_converter.get_text(number_part, factor.gender, case)
+        )
+        parts.append(factor_converter.get_text(number_part, case, factor))
 
-        if factor >= Factor.THOUSANDS and number_part:
-            parts.append(factor_converter.get_text(number_part, case, factor))
+    return ' '.join(parts)
 
-            # The factor determines the gender of a part of a number.
-            number_part_gender = factor.gender
 
-        if number_part:
-            numeral_part = number_converter.get_text(
-                number_part,
-                number_part_gender,
+def convert_many_(
+    numbers: Iterable[int],
+    gender: GenderType,
+    case: CaseType,
+    number_converter: NumberConverterABC,
+    factor_converter: FactorConverterABC,
+) -> list[str]:
+    """Convert integers to a string representations.
+
+    Repeated numbers of the batch are converted once.
+
+    Parameters
+    ----------
+    numbers : `Iterable[int]`
+        The numbers that will be converted into numerals.
+    gender : `GenderType`
+        Grammatical gender of numerals.
+    case : `CaseType`
+        Case of numerals.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+
+    Returns
+    -------
+    `list[str]`
+        The string representations in the order of input.
+
+    """
+    converted: dict[int, str] = {}
+    numerals: list[str] = []
+
+    for number in numbers:
+        if number not in converted:
+            converted[number] = convert_number_(
+                number,
+                gender,
                 case,
+                number_converter,
+                factor_converter,
             )
-            parts.append(numeral_part)
+        numerals.append(converted[number])
 
-        factor_exponent += 1
+    return numerals
+
+
+def convert_ordinal_(
+    number: int,
+    gender: GenderType,
+    case: CaseType,
+    number_converter: NumberConverterABC,
+    factor_converter: FactorConverterABC,
+    ordinal_converter: OrdinalConverterABC,
+) -> str:
+    """Convert an integer to an ordinal string representation.
+
+    The higher triads are cardinal in the nominative,
+    the last non-zero triad is ordinal.
+
+    Parameters
+    ----------
+    number : `int`
+        The number that will be converted into a numeral.
+    gender : `GenderType`
+        Grammatical gender of a numeral.
+    case : `CaseType`
+        Case of the numeral.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    ordinal_converter : `OrdinalConverterABC`
+        An ordinal converter of number in the range up to 999
+        and round number factors.
+
+    Returns
+    -------
+    `str`
+        The ordinal string representation of integer.
+
+    Raises
+    ------
+    TypeError
+        If the number is not an integer type.
+    ValueError
+        If the number is not non-negative or too large.
+
+    """
+    validate_number(number)
+
+    if number == 0:
+        return ordinal_converter.get_text(0, gender, case)
+
+    *triads, (last_part, last_factor) = split_number(number)
+    parts: list[str] = []
+
+    for number_part, factor in triads:
+        parts.append(
+            number_converter.get_text(number_part, factor.gender, 'N')
+        )
+        parts.append(factor_converter.get_text(number_part, 'N', factor))
+
+    if last_factor is Factor.UNITS:
+        parts.append(ordinal_converter.get_text(last_part, gender, case))
+    else:
+        parts.append(
+            ordinal_converter.get_factor_text(
+                last_part,
+                gender,
+                case,
+                last_factor,
+            )
+        )
 
-    parts.reverse()
     return ' '.join(parts)
@@ -0,0 +1,226 @@
+"""Normalization of text by replacing integers with numerals."""
+
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TextIO
+
+from .base import FactorConverterABC, NumberConverterABC
+from .main import MAX_NUMBER, convert_number_
+from .types import CASES, GENDERS, CaseType, GenderType
+
+DEFAULT_SEPARATORS = ' \u00a0\u2009\u202f'
+"""Thousands separators: space, no-break, thin and narrow spaces."""
+CHUNK_SIZE = 1_000
+"""The count of lines normalized by a single worker call."""
+MEMO_SIZE = 10_000
+"""The maximum count of remembered numerals."""
+
+
+class TextNormalizer:
+    """The normalizer of text replacing digit runs with numerals.
+
+    Digit groups separated by the thousands separators are
+    a single number. The digit runs with a leading zero, like codes,
+    and the numbers too large to convert are left as is.
+
+    Parameters
+    ----------
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    gender : `GenderType`
+        Grammatical gender of numerals.
+    case : `CaseType`
+        Case of numerals.
+    separators : `str`
+        Characters separating the thousands.
+
+    Example
+    -------
+    >>> from . import factor_converter, number_converter
+    >>> normalizer = TextNormalizer(number_converter, factor_converter)
+    >>> normalizer.normalize('Тираж: 1 500 000 книг, 12 серий.')
+    'Тираж: один миллион пятьсот тысяч книг, двенадцать серий.'
+
+    """
+
+    def __init__(
+        self,
+        number_converter: NumberConverterABC,
+        factor_converter: FactorConverterABC,
+        gender: GenderType = 'M',
+        case: CaseType = 'N',
+        separators: str = DEFAULT_SEPARATORS,
+    ) -> None:
+        """Construct the normalizer."""
+        if gender not in GENDERS or case not in CASES:
+            raise KeyError(f'Got unexpected flags: {gender}, {case}')
+
+        self._number_converter = number_converter
+        self._factor_converter = factor_converter
+        self._gender = gender
+        self._case = case
+        self._separators = separators
+        self._pattern = _compile_pattern(separators)
+        self._strip = str.maketrans('', '', separators)
+        self._numerals: dict[str, str] = {}
+
+    def __reduce__(
+        self,
+    ) -> tuple[type['TextNormalizer'], tuple[object, ...]]:
+        """Pickle the normalizer for workers without remembered ones."""
+        return type(self), (
+            self._number_converter,
+            self._factor_converter,
+            self._gender,
+            self._case,
+            self._separators,
+        )
+
+    def normalize(self, text: str) -> str:
+        """Replace the integers of text with numerals.
+
+        Parameters
+        ----------
+        text : `str`
+            The text to normalize.
+
+        Returns
+        -------
+        `str`
+            The normalized text.
+
+        """
+        return self._pattern.sub(self._replace, text)
+
+    def normalize_lines(
+        self,
+        lines: Iterable[str],
+        processes: int | None = None,
+    ) -> Iterator[str]:
+        """Replace the integers of lines with numerals lazily.
+
+        Parameters
+        ----------
+        lines : `Iterable[str]`
+            The lines of text to normalize.
+        processes : `int | None`
+            The count of worker processes, the lines are normalized
+            in the current process if None.
+
+        Returns
+        -------
+        `Iterator[str]`
+            The normalized lines in the order of input.
+
+        """
+        if processes is None:
+            return map(self.normalize, lines)
+        return self._normalize_parallel(lines, processes)
+
+    def normalize_file(
+        self,
+        source: TextIO,
+        target: TextIO,
+        processes: int | None = None,
+    ) -> None:
+        """Write the normalized text of the source to the target.
+
+        Parameters
+        ----------
+        source : `TextIO`
+            The text file to normalize.
+        target : `TextIO`
+            The text file to write.
+        processes : `int | None`
+            The count of worker processes, the lines are normalized
+            in the current process if None.
+
+        """
+        target.writelines(self.normalize_lines(source, processes))
+
+    def _normalize_parallel(
+        self,
+        lines: Iterable[str],
+        processes: int,
+    ) -> Iterator[str]:
+        """Normalize the chunks of lines in the worker processes."""
+        iterator = iter(lines)
+        pending: deque[Future[list[str]]] = deque()
+
+        with ProcessPoolExecutor(
+            processes,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            while chunk := list(islice(iterator, CHUNK_SIZE)):
+                pending.append(executor.submit(_normalize_chunk, chunk))
+                # Two chunks per worker keep them busy
+                # while the lines are read and written.
+                if len(pending) >= 2 * processes:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    def _replace(self, match: re.Match[str]) -> str:
+        """Get the numeral of matched digits."""
+        digits = match.group()
+
+        try:
+            return self._numerals[digits]
+        except KeyError:
+            pass
+
+        if digits[0] == '0' and len(digits) > 1:
+            return digits
+
+        number = int(digits.translate(self._strip))
+        if number > MAX_NUMBER:
+            return digits
+
+        if len(self._numerals) >= MEMO_SIZE:
+            self._numerals.clear()
+        numeral = self._numerals[digits] = self._convert(number)
+        return numeral
+
+    def _convert(self, number: int) -> str:
+        """Convert the integer to numeral."""
+        return convert_number_(
+            number,
+            self._gender,
+            self._case,
+            self._number_converter,
+            self._factor_converter,
+        )
+
+
+def _compile_pattern(separators: str) -> re.Pattern[str]:
+    """Compile the pattern of digit runs with thousands separators."""
+    if not separators:
+        return re.compile('[0-9]+')
+
+    separator = f'[{re.escape(separators)}]'
+    return re.compile(
+        rf'(?<![0-9])[0-9]{{1,3}}(?:{separator}[0-9]{{3}})+(?![0-9])|[0-9]+'
+    )
+
+
+_worker_normalizer: TextNormalizer | None = None
+
+
+def _init_worker(normalizer: TextNormalizer) -> None:
+    """Set the normalizer of the worker process."""
+    global _worker_normalizer
+    _worker_normalizer = normalizer
+
+
+def _normalize_chunk(lines: list[str]) -> list[str]:
+    """Normalize the lines in the worker process."""
+    if _worker_normalizer is None:
+        raise RuntimeError('The worker normalizer is not initialized')
+    return [_worker_normalizer.normalize(line) for line in lines]
@@ -0,0 +1,208 @@
+"""Converting an integer to numerals in every gender and case."""
+
+from collections.abc import Iterable
+
+from .base import FactorConverterABC, NumberConverterABC
+from .main import split_number, validate_number
+from .types import CASES, GENDERS, Case, CaseType, Factor, Gender, GenderType
+
+
+class ParadigmBuilder:
+    """The builder of all gender and case forms of a number.
+
+    Triad numerals are remembered by the builder, so the
+    numbers sharing the thousand triads are converted once.
+
+    Parameters
+    ----------
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+
+    """
+
+    def __init__(
+        self,
+        number_converter: NumberConverterABC,
+        factor_converter: FactorConverterABC,
+    ) -> None:
+        """Construct the builder."""
+        self._number_converter = number_converter
+        self._factor_converter = factor_converter
+        self._factor_parts: dict[tuple[int, Factor], tuple[str, ...]] = {}
+        self._unit_parts: dict[int, tuple[tuple[str, ...], ...]] = {}
+
+    def build(self, number: int, deduplicate: bool = False) -> Case:
+        """Get the numerals of number in every gender and case.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that will be converted into numerals.
+        deduplicate : `bool`
+            Replace the gender forms with a single numeral
+            if they coincide, as in the numeral tables.
+
+        Returns
+        -------
+        `Case`
+            Numerals by case, each contains numerals by gender.
+
+        Raises
+        ------
+        TypeError
+            If the number is not an integer type.
+        ValueError
+            If the number is not non-negative or too large.
+
+        """
+        validate_number(number)
+
+        if number == 0:
+            unit_parts = self._get_unit_parts(0)
+            factor_parts: list[tuple[str, ...]] = []
+        else:
+            triads = split_number(number)
+            factor_parts = [
+                self._get_factor_parts(number_part, factor)
+                for number_part, factor in triads
+                if factor is not Factor.UNITS
+            ]
+            number_part, factor = triads[-1]
+            unit_parts = (
+                self._get_unit_parts(number_part)
+                if factor is Factor.UNITS
+                else ()
+            )
+
+        cases: list[Gender | str] = []
+
+        for case_index in range(len(CASES)):
+            prefix = ' '.join(part[case_index] for part in factor_parts)
+
+            if unit_parts:
+                genders = Gender(
+                    *(
+                        f'{prefix} {numeral}' if prefix else numeral
+                        for numeral in unit_parts[case_index]
+                    )
+                )
+            else:
+                # The gender does not affect the round factor numbers.
+                genders = Gender(prefix, prefix, prefix)
+
+            cases.append(_collapse(genders) if deduplicate else genders)
+
+        return Case(*cases)
+
+    def _get_factor_parts(
+        self,
+        number_part: int,
+        factor: Factor,
+    ) -> tuple[str, ...]:
+        """Get the triad numerals with its factor, one per case."""
+        key = number_part, factor
+        if key not in self._factor_parts:
+            converter = self._number_converter
+            factor_cases = self._factor_converter.get_cases(
+                number_part, factor
+            )
+            self._factor_parts[key] = tuple(
+                f'{converter.get_text(number_part, factor.gender, case)} '
+                f'{getattr(factor_cases, CASES[case])}'
+                for case in CASES
+            )
+        return self._factor_parts[key]
+
+    def _get_unit_parts(self, number_part: int) -> tuple[tuple[str, ...], ...]:
+        """Get the lowest triad numerals by case and gender."""
+        if number_part not in self._unit_parts:
+            self._unit_parts[number_part] = tuple(
+                tuple(
+                    self._convert_units(number_part, gender, case)
+                    for gender in GENDERS
+                )
+                for case in CASES
+            )
+        return self._unit_parts[number_part]
+
+    def _convert_units(
+        self,
+        number_part: int,
+        gender: GenderType,
+        case: CaseType,
+    ) -> str:
+        """Get the lowest triad numeral, including zero."""
+        if number_part == 0:
+            return self._number_converter.get_numeral(0, gender, case)
+        return self._number_converter.get_text(number_part, gender, case)
+
+
+def _collapse(genders: Gender) -> Gender | str:
+    """Replace the coinciding gender forms with a single numeral."""
+    if len(set(genders)) == 1:
+        return genders.masculine
+    return genders
+
+
+def paradigm_(
+    number: int,
+    number_converter: NumberConverterABC,
+    factor_converter: FactorConverterABC,
+    deduplicate: bool = False,
+) -> Case:
+    """Convert an integer to numerals in every gender and case.
+
+    Parameters
+    ----------
+    number : `int`
+        The number that will be converted into numerals.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    deduplicate : `bool`
+        Replace the gender forms with a single numeral
+        if they coincide.
+
+    Returns
+    -------
+    `Case`
+        Numerals by case, each contains numerals by gender.
+
+    """
+    builder = ParadigmBuilder(number_converter, factor_converter)
+    return builder.build(number, deduplicate)
+
+
+def paradigm_many_(
+    numbers: Iterable[int],
+    number_converter: NumberConverterABC,
+    factor_converter: FactorConverterABC,
+    deduplicate: bool = False,
+) -> list[Case]:
+    """Convert integers to numerals in every gender and case.
+
+    The triad numerals are shared between the numbers of batch.
+
+    Parameters
+    ----------
+    numbers : `Iterable[int]`
+        The numbers that will be converted into numerals.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    deduplicate : `bool`
+        Replace the gender forms with a single numeral
+        if they coincide.
+
+    Returns
+    -------
+    `list[Case]`
+        Numerals of each number in the order of input.
+
+    """
+    builder = ParadigmBuilder(number_converter, factor_converter)
+    return [builder.build(number, deduplicate) for number in numbers]
@@ -0,0 +1,461 @@
+"""Persistent cache of numerals shared between processes.
+
+Pre-populate the cache with historic inputs, a number per line::
+
+    python -m src.number_converter.persistent numerals.db inputs.txt
+
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from os import PathLike
+from types import TracebackType
+from typing import Self
+
+from .base import FactorConverterABC, NumberConverterABC
+from .main import convert_many_, validate_number
+from .types import CASES, GENDERS, CaseType, GenderType
+
+DEFAULT_MAX_SIZE = 10**6
+"""The default maximum count of cached numerals."""
+BATCH_SIZE = 500
+"""The count of numbers in a single query."""
+TIMEOUT = 30.0
+"""Seconds to wait for a lock of another process."""
+MAX_HITS = 10_000
+"""The count of remembered hits written without misses."""
+SCHEMA_VERSION = 2
+"""The version of the tables layout, a part of the fingerprint."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS numerals (
+    number INTEGER NOT NULL,
+    form TEXT NOT NULL,
+    numeral TEXT NOT NULL,
+    used INTEGER NOT NULL,
+    UNIQUE (number, form)
+)
+"""
+USED_INDEX = 'CREATE INDEX IF NOT EXISTS numerals_used ON numerals (used)'
+META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+"""
+PROBE_NUMBERS = (
+    *range(20),
+    *range(20, 100, 10),
+    *range(100, 1_000, 100),
+    *(factor * n for factor in (10**3, 10**6, 10**9) for n in (1, 2, 5)),
+)
+"""The numbers covering each numeral table of a language."""
+
+
+class PersistentCache:
+    """The on-disk cache of numerals in a SQLite database.
+
+    The cache is keyed on the number, gender and case. The database
+    is in the write-ahead log mode, so the processes can read
+    it while another one writes. When the cache exceeds
+    the maximum size, the least recently used numerals are evicted,
+    so the warmed numerals stay while they are requested.
+
+    A hit is a plain read, the hits are remembered and marked
+    as used with the next written misses, or when `MAX_HITS`
+    are remembered, or on closing.
+
+    The database stores the fingerprint of numerals
+    of the converters. When the cache is opened by converters
+    producing other numerals, like another language or
+    recompiled tables, the cached numerals are removed.
+
+    Parameters
+    ----------
+    path : `str | PathLike[str]`
+        The path of database file.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    max_size : `int | None`
+        The maximum count of cached numerals, unlimited if None.
+
+    Example
+    -------
+    >>> from . import factor_converter, number_converter
+    >>> with PersistentCache(
+    ...     ':memory:', number_converter, factor_converter
+    ... ) as cache:
+    ...     cache.convert_many([1, 2, 1], 'F', 'N')
+    ...     len(cache)
+    ['одна', 'две', 'одна']
+    2
+
+    """
+
+    def __init__(
+        self,
+        path: str | PathLike[str],
+        number_converter: NumberConverterABC,
+        factor_converter: FactorConverterABC,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Construct the cache, create the database if not exists."""
+        if max_size is not None and max_size < 1:
+            raise ValueError(f'Maximum size must be positive, got {max_size}')
+
+        self._number_converter = number_converter
+        self._factor_converter = factor_converter
+        self._max_size = max_size
+        self._hits: dict[str, set[int]] = {}
+        self._hit_count = 0
+        self._connection = sqlite3.connect(path, timeout=TIMEOUT)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._check_fingerprint()
+
+    def __enter__(self) -> Self:
+        """Return the cache."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the count of cached numerals."""
+        query = 'SELECT COUNT(*) FROM numerals'
+        return self._connection.execute(query).fetchone()[0]  # type: ignore[no-any-return]
+
+    def close(self) -> None:
+        """Mark the remembered hits as used, close the database."""
+        if self._hits:
+            self._write([])
+        self._connection.close()
+
+    def clear(self) -> None:
+        """Remove all cached numerals."""
+        self._hits.clear()
+        self._hit_count = 0
+        with self._connection:
+            self._connection.execute('DELETE FROM numerals')
+            self._connection.execute(
+                "UPDATE meta SET value = 0 WHERE key = 'size'"
+            )
+
+    def convert(self, number: int, gender: GenderType, case: CaseType) -> str:
+        """Convert an integer to a string representation.
+
+        Parameters
+        ----------
+        number : `int`
+            The number that will be converted into a numeral.
+        gender : `GenderType`
+            Grammatical gender of a numeral.
+        case : `CaseType`
+            Case of the numeral.
+
+        Returns
+        -------
+        `str`
+            The string representation of integer.
+
+        """
+        return self.convert_many([number], gender, case)[0]
+
+    def convert_many(
+        self,
+        numbers: Iterable[int],
+        gender: GenderType,
+        case: CaseType,
+    ) -> list[str]:
+        """Convert integers to a string representations.
+
+        The cached numerals are read by a batch, the missing ones
+        are converted and written by a batch.
+
+        Parameters
+        ----------
+        numbers : `Iterable[int]`
+            The numbers that will be converted into numerals.
+        gender : `GenderType`
+            Grammatical gender of numerals.
+        case : `CaseType`
+            Case of numerals.
+
+        Returns
+        -------
+        `list[str]`
+            The string representations in the order of input.
+
+        Raises
+        ------
+        KeyError
+            If the gender or case is unexpected.
+        TypeError
+            If a number is not an integer type.
+        ValueError
+            If a number is not non-negative or too large.
+
+        """
+        numbers = list(numbers)
+        form = _get_form(gender, case)
+        # SQLite can not store the numbers out of the range.
+        for number in numbers:
+            validate_number(number)
+
+        numerals = self._read(set(numbers), form)
+
+        if missing := [n for n in dict.fromkeys(numbers) if n not in numerals]:
+            converted = convert_many_(
+                missing,
+                gender,
+                case,
+                self._number_converter,
+                self._factor_converter,
+            )
+            numerals.update(zip(missing, converted, strict=True))
+            self._write(
+                [
+                    (number, form, numeral)
+                    for number, numeral in zip(missing, converted, strict=True)
+                ]
+            )
+        elif self._hit_count >= MAX_HITS:
+            self._write([])
+
+        return [numerals[number] for number in numbers]
+
+    def warm(
+        self,
+        numbers: Iterable[int],
+        genders: Iterable[GenderType] = GENDERS,
+        cases: Iterable[CaseType] = CASES,
+    ) -> None:
+        """Pre-populate the cache with numerals of numbers.
+
+        Parameters
+        ----------
+        numbers : `Iterable[int]`
+            The numbers that will be converted into numerals.
+        genders : `Iterable[GenderType]`
+            Grammatical genders of numerals, all by default.
+        cases : `Iterable[CaseType]`
+            Cases of numerals, all by default.
+
+        """
+        cases = list(cases)
+        genders = list(genders)
+
+        for batch in _batched(numbers, BATCH_SIZE):
+            for gender in genders:
+                for case in cases:
+                    self.convert_many(batch, gender, case)
+
+    def get_fingerprint(self) -> str:
+        """Get the fingerprint of converters and the database schema.
+
+        The fingerprint is the hash of probe numerals
+        of the converters in all genders and cases.
+
+        Returns
+        -------
+        `str`
+            The hexadecimal digest.
+
+        """
+        digest = hashlib.sha256(f'{SCHEMA_VERSION}{SCHEMA}'.encode())
+
+        for gender in GENDERS:
+            for case in CASES:
+                numerals = convert_many_(
+                    PROBE_NUMBERS,
+                    gender,
+                    case,
+                    self._number_converter,
+                    self._factor_converter,
+                )
+                digest.update('\n'.join(numerals).encode())
+
+        return digest.hexdigest()
+
+    def _check_fingerprint(self) -> None:
+        """Create the tables, remove numerals of other converters."""
+        fingerprint = self.get_fingerprint()
+        query = "SELECT value FROM meta WHERE key = 'fingerprint'"
+
+        with self._connection:
+            # Lock the database, so a single process
+            # replaces the tables.
+            self._connection.execute('BEGIN IMMEDIATE')
+            self._connection.execute(META_SCHEMA)
+            if self._connection.execute(query).fetchone() == (fingerprint,):
+                return
+
+            self._connection.execute('DROP TABLE IF EXISTS numerals')
+            self._connection.execute(SCHEMA)
+            self._connection.execute(USED_INDEX)
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                [('fingerprint', fingerprint), ('size', 0)],
+            )
+
+    def _read(self, numbers: set[int], form: str) -> dict[int, str]:
+        """Read the cached numerals of numbers, remember the hits."""
+        numerals: dict[int, str] = {}
+
+        for batch in _batched(numbers, BATCH_SIZE):
+            query = (
+                'SELECT number, numeral FROM numerals '
+                f'WHERE form = ? AND number IN ({", ".join("?" * len(batch))})'
+            )
+            numerals.update(self._connection.execute(query, [form, *batch]))
+
+        if numerals:
+            hits = self._hits.setdefault(form, set())
+            self._hit_count += len(numerals.keys() - hits)
+            hits.update(numerals)
+
+        return numerals
+
+    def _write(self, rows: list[tuple[int, str, str]]) -> None:
+        """Write the numerals and mark the remembered hits as used.
+
+        The written and hit numerals share the tick of last use,
+        the least recently used ones are evicted over the size.
+        """
+        with self._connection:
+            self._connection.execute('BEGIN IMMEDIATE')
+            used = self._connection.execute(
+                'SELECT COALESCE(MAX(used), 0) + 1 FROM numerals'
+            ).fetchone()[0]
+
+            for form, numbers in self._hits.items():
+                for batch in _batched(numbers, BATCH_SIZE):
+                    self._connection.execute(
+                        'UPDATE numerals SET used = ? WHERE form = ? '
+                        f'AND number IN ({", ".join("?" * len(batch))})',
+                        [used, form, *batch],
+                    )
+            self._hits.clear()
+            self._hit_count = 0
+
+            size = int(
+                self._connection.execute(
+                    "SELECT value FROM meta WHERE key = 'size'"
+                ).fetchone()[0]
+            )
+            size += self._connection.executemany(
+                'INSERT OR IGNORE INTO numerals VALUES (?, ?, ?, ?)',
+                ((*row, used) for row in rows),
+            ).rowcount
+
+            if self._max_size is not None and size > self._max_size:
+                size -= self._connection.execute(
+                    'DELETE FROM numerals WHERE rowid IN ('
+                    'SELECT rowid FROM numerals '
+                    'ORDER BY used, rowid LIMIT ?)',
+                    (size - self._max_size,),
+                ).rowcount
+
+            self._connection.execute(
+                "UPDATE meta SET value = ? WHERE key = 'size'", (size,)
+            )
+
+
+def _get_form(gender: GenderType, case: CaseType) -> str:
+    """Get the key of the gender and case."""
+    if gender not in GENDERS or case not in CASES:
+        raise KeyError(f'Got unexpected flags: {gender}, {case}')
+    return f'{gender}{case}'
+
+
+def _batched(numbers: Iterable[int], size: int) -> Iterator[list[int]]:
+    """Split the numbers into lists of size."""
+    iterator = iter(numbers)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _read_numbers(lines: Iterable[str]) -> Iterator[int]:
+    """Get the numbers of non-empty lines."""
+    for line in lines:
+        if line := line.strip():
+            yield int(line)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Pre-populate the cache with the numbers of input files.
+
+    Parameters
+    ----------
+    argv : `Sequence[str] | None`
+        Command line arguments, the process arguments by default.
+
+    Returns
+    -------
+    `int`
+        Exit status.
+
+    """
+    from . import factor_converter, number_converter
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='the path of database file')
+    parser.add_argument(
+        'inputs',
+        nargs='*',
+        type=argparse.FileType(encoding='utf-8'),
+        default=[sys.stdin],
+        help='files with a number per line, stdin by default',
+    )
+    parser.add_argument(
+        '-g',
+        '--gender',
+        action='append',
+        choices=GENDERS,
+        help='grammatical genders, all by default',
+    )
+    parser.add_argument(
+        '-c',
+        '--case',
+        action='append',
+        choices=CASES,
+        help='grammatical cases, all by default',
+    )
+    parser.add_argument(
+        '--max-size',
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help='the maximum count of cached numerals',
+    )
+    args = parser.parse_args(argv)
+
+    with PersistentCache(
+        args.path,
+        number_converter,
+        factor_converter,
+        args.max_size,
+    ) as cache:
+        for file in args.inputs:
+            cache.warm(
+                _read_numbers(file),
+                args.gender or GENDERS,
+                args.case or CASES,
+            )
+        print(f'Cached numerals: {len(cache)}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Asynchronous streaming conversion of integers to numerals."""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from functools import partial
+
+from .base import FactorConverterABC, NumberConverterABC
+from .main import convert_many_
+from .types import CaseType, GenderType
+
+DEFAULT_CHUNK_SIZE = 1_000
+DEFAULT_MAX_PENDING = 4
+DEFAULT_MAX_DELAY = 0.05
+
+
+async def aconvert_stream_(
+    numbers: AsyncIterable[int],
+    gender: GenderType,
+    case: CaseType,
+    number_converter: NumberConverterABC,
+    factor_converter: FactorConverterABC,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    executor: Executor | None = None,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> AsyncIterator[str]:
+    """Convert a stream of integers without blocking the event loop.
+
+    The numbers are grouped into chunks, each chunk is converted
+    in the executor and yielded as soon as it is converted.
+    A partial chunk is converted once the stream waits
+    for the next number longer than the maximum delay.
+    The stream is not read further while the maximum
+    of chunks is pending.
+
+    Parameters
+    ----------
+    numbers : `AsyncIterable[int]`
+        The numbers that will be converted into numerals.
+    gender : `GenderType`
+        Grammatical gender of numerals.
+    case : `CaseType`
+        Case of numerals.
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+    chunk_size : `int`
+        The count of numbers converted by a single executor call.
+    max_pending : `int`
+        The maximum count of chunks converted at once.
+    executor : `Executor | None`
+        The thread or process executor,
+        the event loop default executor if None.
+    max_delay : `float`
+        The time in seconds a partial chunk waits for the next number.
+
+    Yields
+    ------
+    `str`
+        The string representations in the order of input.
+
+    Raises
+    ------
+    ValueError
+        If the chunk size or maximum of pending chunks is not positive,
+        or the maximum delay is negative.
+
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, got {chunk_size}')
+    if max_pending < 1:
+        raise ValueError(
+            f'Maximum pending chunks must be positive, got {max_pending}'
+        )
+    if max_delay < 0:
+        raise ValueError(
+            f'Maximum delay must not be negative, got {max_delay}'
+        )
+
+    loop = asyncio.get_running_loop()
+    convert = partial(
+        convert_many_,
+        gender=gender,
+        case=case,
+        number_converter=number_converter,
+        factor_converter=factor_converter,
+    )
+    # The producer submits a chunk once a pending slot is free,
+    # the slot is released when the numerals of chunk are yielded.
+    slots = asyncio.Semaphore(max_pending)
+    pending: asyncio.Queue[asyncio.Future[list[str]] | None] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for chunk in _group(numbers, chunk_size, max_delay):
+                await slots.acquire()
+                pending.put_nowait(
+                    loop.run_in_executor(executor, convert, chunk)
+                )
+        finally:
+            pending.put_nowait(None)
+
+    producer = asyncio.create_task(produce())
+
+    try:
+        while future := await pending.get():
+            numerals = await future
+            slots.release()
+            for numeral in numerals:
+                yield numeral
+
+        # Raise the error of the numbers stream, if any.
+        await producer
+
+    finally:
+        producer.cancel()
+        while not pending.empty():
+            if future := pending.get_nowait():
+                future.cancel()
+
+
+async def _group(
+    numbers: AsyncIterable[int],
+    chunk_size: int,
+    max_delay: float,
+) -> AsyncIterator[list[int]]:
+    """Group the stream of numbers into chunks.
+
+    The partial chunk is yielded when the next number
+    is not received within the maximum delay.
+    """
+    iterator = aiter(numbers)
+    chunk: list[int] = []
+    next_number: asyncio.Task[int] | None = None
+
+    try:
+        while True:
+            # Without numbers to flush, wait as long as needed.
+            timeout = max_delay if chunk else None
+            next_number = await _receive(iterator, next_number, timeout)
+            if not next_number.done():
+                yield chunk
+                chunk = []
+                continue
+
+            received, next_number = next_number, None
+            try:
+                chunk.append(received.result())
+            except StopAsyncIteration:
+                break
+
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    finally:
+        if next_number is not None:
+            next_number.cancel()
+
+
+async def _receive(
+    iterator: AsyncIterator[int],
+    next_number: asyncio.Task[int] | None,
+    timeout: float | None,
+) -> asyncio.Task[int]:
+    """Wait for the next number up to the timeout.
+
+    The number is received by an eager task, it completes at once
+    if the number is ready. The task is returned done or pending,
+    a pending one is awaited on the next call.
+    """
+    if next_number is None:
+        next_number = asyncio.Task(
+            _next(iterator),
+            loop=asyncio.get_running_loop(),
+            eager_start=True,
+        )
+    if not next_number.done():
+        await asyncio.wait({next_number}, timeout=timeout)
+
+    return next_number
+
+
+async def _next(iterator: AsyncIterator[int]) -> int:
+    """Get the next number of the stream."""
+    return await anext(iterator)
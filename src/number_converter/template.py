@@ -0,0 +1,376 @@
+"""Rendering of text templates with numbers in words."""
+
+import re
+import string
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple, override
+
+from .base import FactorConverterABC, NumberConverterABC
+from .main import convert_many_, convert_number_
+from .types import CASES, GENDERS, CaseType, GenderType
+
+WORDS_SPEC = 'words'
+"""Format specification prefix of the numeral fields."""
+SPEC_SEPARATOR = ':'
+DEFAULT_GENDER: GenderType = 'M'
+DEFAULT_CASE: CaseType = 'N'
+
+Numeral = tuple[GenderType, CaseType]
+FieldValue = tuple[Numeral | None, Any]
+
+
+class TemplateField(NamedTuple):
+    """The compiled template field with its preceding text."""
+
+    literal: str
+    field_name: str | None
+    conversion: str | None
+    format_spec: str
+    numeral: Numeral | None
+
+
+def parse_numeral_spec(format_spec: str) -> Numeral | None:
+    """Get the gender and case of the numeral format specification.
+
+    Parameters
+    ----------
+    format_spec : `str`
+        The format specification like ``words:M:G``,
+        the gender and case may be omitted.
+
+    Returns
+    -------
+    `tuple[GenderType, CaseType] | None`
+        The gender and case of numeral, None if the specification
+        is not a numeral one.
+
+    Raises
+    ------
+    ValueError
+        If the gender or case is unexpected.
+
+    Example
+    -------
+    >>> parse_numeral_spec('words:F:D')
+    ('F', 'D')
+    >>> parse_numeral_spec('words')
+    ('M', 'N')
+    >>> parse_numeral_spec('>10') is None
+    True
+
+    """
+    name, *flags = format_spec.split(SPEC_SEPARATOR)
+    if name != WORDS_SPEC:
+        return None
+
+    if len(flags) > 2:
+        raise ValueError(f'Got unexpected numeral format: {format_spec!r}')
+
+    gender, case = flags + [DEFAULT_GENDER, DEFAULT_CASE][len(flags) :]
+
+    if gender not in GENDERS:
+        raise ValueError(f'Got unexpected gender: {gender}, use {[*GENDERS]}')
+    if case not in CASES:
+        raise ValueError(f'Got unexpected case: {case}, use {[*CASES]}')
+
+    return gender, case
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> tuple[TemplateField, ...]:
+    """Parse the template once into fields.
+
+    The automatic field numbering is resolved at compilation,
+    including the fields nested in format specifications.
+    The numeral of a specification with nested fields
+    is resolved per call.
+
+    Parameters
+    ----------
+    template : `str`
+        The template in the format string syntax.
+
+    Returns
+    -------
+    `tuple[TemplateField, ...]`
+        Compiled fields of the template.
+
+    Raises
+    ------
+    ValueError
+        If the template syntax or numeral format is wrong.
+
+    """
+    fields: list[TemplateField] = []
+    auto_index = 0
+    numbering: set[bool] = set()
+
+    def number_field(field_name: str) -> str:
+        """Resolve the automatic numbering of the field name."""
+        nonlocal auto_index
+        first = re.split(r'[.\[]', field_name, maxsplit=1)[0]
+
+        if first == '':
+            field_name = f'{auto_index}{field_name}'
+            auto_index += 1
+            numbering.add(True)
+        elif first.isdigit():
+            numbering.add(False)
+
+        if len(numbering) > 1:
+            raise ValueError(
+                'Cannot switch between automatic and manual field numbering'
+            )
+        return field_name
+
+    parsed = string.Formatter().parse(template)
+
+    for literal, field_name, format_spec, conversion in parsed:
+        format_spec = format_spec or ''
+        numeral = None
+
+        if field_name is not None:
+            field_name = number_field(field_name)
+
+            if '{' in format_spec:
+                format_spec = _number_spec(format_spec, number_field)
+            else:
+                numeral = parse_numeral_spec(format_spec)
+
+        fields.append(
+            TemplateField(
+                literal,
+                field_name,
+                conversion,
+                format_spec,
+                numeral,
+            )
+        )
+
+    return tuple(fields)
+
+
+def _number_spec(format_spec: str, number_field: Callable[[str], str]) -> str:
+    """Rebuild the format specification with nested fields numbered."""
+    parts: list[str] = []
+    parsed = string.Formatter().parse(format_spec)
+
+    for literal, field_name, nested_spec, conversion in parsed:
+        parts.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field_name is None:
+            continue
+
+        parts.append('{' + number_field(field_name))
+        if conversion:
+            parts.append(f'!{conversion}')
+        if nested_spec:
+            parts.append(f':{nested_spec}')
+        parts.append('}')
+
+    return ''.join(parts)
+
+
+class NumeralFormatter(string.Formatter):
+    """The formatter of templates with numbers in words.
+
+    The ``words`` format specification converts the field
+    to numeral, it accepts the gender and case flags:
+    ``{amount:words:F:G}``.
+
+    Parameters
+    ----------
+    number_converter : `NumberConverterABC`
+        A number converter of number in the range up to 999.
+    factor_converter : `FactorConverterABC`
+        A number factor converter of number in the range up to billion.
+
+    Example
+    -------
+    >>> from .cases import FACTOR_CASES, NUMERAL_CASES
+    >>> from .converters import FactorConverter, NumberConverter
+    >>> formatter = NumeralFormatter(
+    ...     NumberConverter(NUMERAL_CASES),
+    ...     FactorConverter(FACTOR_CASES),
+    ... )
+    >>> formatter.render('{} из {total:words:F:G}', 2, total=21)
+    '2 из двадцати одной'
+
+    """
+
+    def __init__(
+        self,
+        number_converter: NumberConverterABC,
+        factor_converter: FactorConverterABC,
+    ) -> None:
+        """Construct the formatter."""
+        super().__init__()
+        self._number_converter = number_converter
+        self._factor_converter = factor_converter
+
+    @override
+    def format_field(self, value: Any, format_spec: str) -> Any:
+        """Format the field, numeral specification converts to words."""
+        if numeral := parse_numeral_spec(format_spec):
+            return convert_number_(
+                value,
+                *numeral,
+                self._number_converter,
+                self._factor_converter,
+            )
+        return super().format_field(value, format_spec)
+
+    def render(self, template: str, /, *args: object, **kwargs: object) -> str:
+        """Render the template compiled once per template string.
+
+        Parameters
+        ----------
+        template : `str`
+            The template in the format string syntax.
+        *args : `object`
+            Positional fields of the template.
+        **kwargs : `object`
+            Keyword fields of the template.
+
+        Returns
+        -------
+        `str`
+            The rendered text.
+
+        """
+        parts: list[str] = []
+
+        for field in compile_template(template):
+            parts.append(field.literal)
+            if field.field_name is None:
+                continue
+
+            value = self._get_value(field, args, kwargs)
+            if field.numeral:
+                parts.append(
+                    convert_number_(
+                        value,
+                        *field.numeral,
+                        self._number_converter,
+                        self._factor_converter,
+                    )
+                )
+            else:
+                spec = self._get_spec(field, args, kwargs)
+                parts.append(self.format_field(value, spec))
+
+        return ''.join(parts)
+
+    def render_many(
+        self,
+        template: str,
+        rows: Iterable[Mapping[str, Any]],
+    ) -> list[str]:
+        """Render the template for each row of keyword fields.
+
+        Numerals of all rows are converted as batches
+        grouped by gender and case.
+
+        Parameters
+        ----------
+        template : `str`
+            The template in the format string syntax
+            with named fields.
+        rows : `Iterable[Mapping[str, Any]]`
+            Keyword fields of the template for each row.
+
+        Returns
+        -------
+        `list[str]`
+            The rendered texts in the order of rows.
+
+        """
+        fields = compile_template(template)
+        batches: dict[Numeral, list[int]] = {}
+        values = [self._get_row_values(fields, row, batches) for row in rows]
+
+        numerals = {
+            numeral: dict(
+                zip(
+                    numbers,
+                    convert_many_(
+                        numbers,
+                        *numeral,
+                        self._number_converter,
+                        self._factor_converter,
+                    ),
+                    strict=True,
+                )
+            )
+            for numeral, numbers in batches.items()
+        }
+
+        texts: list[str] = []
+
+        for row_values in values:
+            parts: list[str] = []
+            for field, (numeral, value) in zip(
+                fields, row_values, strict=True
+            ):
+                parts.append(field.literal)
+                if field.field_name is None:
+                    continue
+                if numeral:
+                    value = numerals[numeral][value]
+                parts.append(value)
+            texts.append(''.join(parts))
+
+        return texts
+
+    def _get_row_values(
+        self,
+        fields: tuple[TemplateField, ...],
+        row: Mapping[str, Any],
+        batches: dict[Numeral, list[int]],
+    ) -> list[FieldValue]:
+        """Get the field values of row, collect the numbers to batches.
+
+        The numeral fields keep the number to convert,
+        the other fields are formatted.
+        """
+        row_values: list[FieldValue] = []
+
+        for field in fields:
+            if field.field_name is None:
+                row_values.append((None, None))
+                continue
+
+            value = self._get_value(field, (), row)
+            numeral = field.numeral
+            if numeral is None:
+                spec = self._get_spec(field, (), row)
+                numeral = parse_numeral_spec(spec)
+                if numeral is None:
+                    value = self.format_field(value, spec)
+
+            if numeral:
+                batches.setdefault(numeral, []).append(value)
+            row_values.append((numeral, value))
+
+        return row_values
+
+    def _get_value(
+        self,
+        field: TemplateField,
+        args: tuple[object, ...],
+        kwargs: Mapping[str, object],
+    ) -> Any:  # noqa: ANN401
+        """Get the field value with its conversion applied."""
+        value, _ = self.get_field(field.field_name, args, kwargs)  # type: ignore[arg-type]
+        return self.convert_field(value, field.conversion)
+
+    def _get_spec(
+        self,
+        field: TemplateField,
+        args: tuple[object, ...],
+        kwargs: Mapping[str, object],
+    ) -> str:
+        """Get the format specification with nested fields resolved."""
+        if '{' in field.format_spec:
+            return self.vformat(field.format_spec, args, kwargs)
+        return field.format_spec
@@ -22,6 +22,13 @@ CASES: dict[CaseType, str] = {
     'P': 'prepositional',
 }
 
+FORMS: dict[tuple[GenderType, CaseType], int] = {
+    (gender, case): case_index * len(GENDERS) + gender_index
+    for case_index, case in enumerate(CASES)
+    for gender_index, gender in enumerate(GENDERS)
+}
+"""Index of the numeral form in the compiled tables."""
+
 
 class Gender(NamedTuple):
     """Grammatical gender presentation of number."""
@@ -111,3 +118,54 @@ class CaseGroup(Enum):
         else:
             # Include: 25, ..., 30, 35, ..., 40, etc.
             return cls.OTHER
+
+
+class Ordinal(NamedTuple):
+    """Ordinal numeral declined as an adjective."""
+
+    stem: str
+    endings: Case
+
+
+class LanguageData(NamedTuple):
+    """Declarative numeral data of a language."""
+
+    numeral_cases: dict[int, Case]
+    factor_cases: dict[Factor, dict[CaseGroup, Case]]
+    tens_endings: Case
+    hundreds_endings: Case
+    ordinal_cases: dict[int, Ordinal]
+    ordinal_factors: dict[Factor, Ordinal]
+    fused_numerals: dict[int, str]
+    fused_triads: dict[int, str]
+
+
+class Tables(NamedTuple):
+    """Flat lookup tables of numerals compiled from language data.
+
+    The numerals are indexed by the form from `FORMS`,
+    then by the digit. The factor names are indexed by the factor,
+    then by the case group from `CaseGroup` order, then by the case,
+    the ordinal factor names by the factor, then by the form.
+    The fused numerals are the prefixes of round ordinal factors,
+    indexed by the digit.
+    """
+
+    zero: tuple[str, ...]
+    units: tuple[tuple[str, ...], ...]
+    teens: tuple[tuple[str, ...], ...]
+    tens: tuple[tuple[str, ...], ...]
+    hundreds: tuple[tuple[str, ...], ...]
+    factors: tuple[tuple[tuple[str, ...], ...], ...]
+    case_groups: tuple[int, ...]
+    ordinal_zero: tuple[str, ...]
+    ordinal_units: tuple[tuple[str, ...], ...]
+    ordinal_teens: tuple[tuple[str, ...], ...]
+    ordinal_tens: tuple[tuple[str, ...], ...]
+    ordinal_hundreds: tuple[tuple[str, ...], ...]
+    ordinal_factors: tuple[tuple[str, ...], ...]
+    fused_units: tuple[str, ...]
+    fused_teens: tuple[str, ...]
+    fused_tens: tuple[str, ...]
+    fused_hundreds: tuple[str, ...]
+    fused_triads: tuple[tuple[int, str], ...]
@@ -0,0 +1,104 @@
+"""Testing the compiled numeral tables."""
+
+import pickle
+import sys
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from src.number_converter import compiled
+from src.number_converter.cases import FACTOR_CASES, NUMERAL_CASES
+from src.number_converter.compiled import load_tables
+from src.number_converter.compiler import (
+    LANGUAGES,
+    compile_tables,
+    get_module_path,
+    main,
+    render_module,
+)
+from src.number_converter.converters import (
+    FactorConverter,
+    NumberConverter,
+    TableFactorConverter,
+    TableNumberConverter,
+)
+from src.number_converter.main import convert_number_
+from src.number_converter.types import FORMS, Factor, Tables
+
+
+@pytest.mark.parametrize('code', LANGUAGES)
+def test_compiled_up_to_date(code: str) -> None:
+    """Test the compiled module matches the language data."""
+    source = render_module(code, compile_tables(LANGUAGES[code]))
+
+    assert get_module_path(code).read_text('utf-8') == source
+    assert main(['--check', code]) == 0
+
+
+def test_table_converters() -> None:
+    """Test the table converters match the data-driven ones."""
+    tables = load_tables('ru')
+    converters = [
+        (NumberConverter(NUMERAL_CASES), FactorConverter(FACTOR_CASES)),
+        (TableNumberConverter(tables), TableFactorConverter(tables)),
+    ]
+
+    for number in [*range(1_100), 21_000, 1_002_345, 999_999_999_999]:
+        for gender, case in FORMS:
+            expected, converted = (
+                convert_number_(number, gender, case, *pair)
+                for pair in converters
+            )
+            assert converted == expected
+
+
+def test_unexpected_language() -> None:
+    """Test the language without compiled tables."""
+    with pytest.raises(ValueError):
+        load_tables('xx')
+
+
+def test_tables_loaded_on_first_use() -> None:
+    """Test the converter loads the tables on first conversion."""
+    loaded: list[Tables] = []
+
+    def load() -> Tables:
+        loaded.append(load_tables('ru'))
+        return loaded[-1]
+
+    converter = TableNumberConverter(load)
+    assert not loaded
+
+    assert converter.get_text(21, 'F', 'N') == 'двадцать одна'
+    assert converter.get_text(2, 'F', 'N') == 'две'
+    assert len(loaded) == 1
+
+
+def test_tables_not_pickled() -> None:
+    """Test the loaded tables are not pickled with the converter."""
+    converter = TableFactorConverter(partial(load_tables, 'ru'))
+    size = len(pickle.dumps(converter))
+
+    assert converter.get_text(2, 'N', Factor.THOUSANDS) == 'тысячи'
+    assert len(pickle.dumps(converter)) == size
+
+    restored = pickle.loads(pickle.dumps(converter))
+    assert restored.get_text(5, 'N', Factor.MILLIONS) == 'миллионов'
+
+
+def test_outdated_tables_fail(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the compiled module of outdated fields is not imported."""
+    (tmp_path / 'stale.py').write_text(
+        'from src.number_converter.types import Tables\n'
+        "TABLES = Tables(zero=('ноль',))\n",
+        'utf-8',
+    )
+    monkeypatch.setattr(compiled, '__path__', [str(tmp_path)])
+    monkeypatch.delitem(sys.modules, f'{compiled.__name__}.stale', False)
+
+    with pytest.raises(TypeError):
+        load_tables('stale')
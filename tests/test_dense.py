@@ -0,0 +1,71 @@
+"""Testing the dense tables of numerals."""
+
+import pytest
+
+from src.number_converter import convert_number, dense_cache
+from src.number_converter.types import FORMS
+
+
+def test_dense_cache_matches_conversion() -> None:
+    """Test the cached numerals equal the conversions."""
+    cache = dense_cache(12_345)
+
+    for gender, case in FORMS:
+        table = cache.get_table(gender, case)
+        assert len(table) == 12_345
+        for number in range(12_345):
+            assert table[number] == convert_number(number, gender, case)
+
+
+def test_dense_cache_outside() -> None:
+    """Test the numbers outside of table are converted."""
+    cache = dense_cache(1_000)
+
+    assert cache.convert(1_000, 'M', 'N') == 'одна тысяча'
+    assert cache.nbytes == 0
+
+
+def test_dense_cache_memory() -> None:
+    """Test the tables are built on first use only."""
+    cache = dense_cache(100)
+    assert cache.nbytes == 0
+
+    cache.convert(5, 'M', 'N')
+    nbytes = cache.nbytes
+    cache.convert(6, 'M', 'N')
+
+    assert nbytes == cache.nbytes > 0
+
+
+@pytest.mark.parametrize('size', [1, 999, 1_000, 1_001, 12_345])
+def test_dense_cache_estimate(size: int) -> None:
+    """Test the estimated memory equals the built table memory."""
+    cache = dense_cache(size)
+
+    estimates = {form: cache.estimate_nbytes(*form) for form in FORMS}
+    assert cache.nbytes == 0
+
+    for (gender, case), nbytes in estimates.items():
+        assert nbytes == cache.get_table(gender, case).nbytes
+
+
+@pytest.mark.parametrize('number', [-1, 10**12])
+def test_dense_cache_number_validation(number: int) -> None:
+    """Test unexpected number value."""
+    with pytest.raises(ValueError):
+        dense_cache(10).convert(number, 'M', 'N')
+
+
+@pytest.mark.parametrize('size', [0, 10**12 + 1])
+def test_dense_cache_size_validation(size: int) -> None:
+    """Test unexpected cache size."""
+    with pytest.raises(ValueError):
+        dense_cache(size)
+
+
+def test_dense_cache_flag_validation() -> None:
+    """Test the unexpected flag."""
+    with pytest.raises(KeyError):
+        dense_cache(10).convert(1, 'X', 'N')  # type: ignore[arg-type]
+    with pytest.raises(KeyError):
+        dense_cache(10).estimate_nbytes('M', 'X')  # type: ignore[arg-type]
@@ -0,0 +1,52 @@
+"""Testing the text normalization."""
+
+import io
+
+import pytest
+
+from src.number_converter import text_normalizer
+
+TEXTS = [
+    ('', ''),
+    ('без чисел', 'без чисел'),
+    ('1 500', 'одна тысяча пятьсот'),
+    ('1 500 000', 'один миллион пятьсот тысяч'),
+    ('12 1234', 'двенадцать одна тысяча двести тридцать четыре'),
+    ('7-8 раз', 'семь-восемь раз'),
+    ('10' * 7, '10' * 7),
+    ('0 и 007', 'ноль и 007'),
+    ('код 0123', 'код 0123'),
+]
+
+
+@pytest.mark.parametrize('text, normalized', TEXTS)
+def test_normalize(text: str, normalized: str) -> None:
+    """Test the digit runs are replaced with numerals."""
+    assert text_normalizer().normalize(text) == normalized
+
+
+def test_normalize_gender_case() -> None:
+    """Test the caller-supplied gender and case."""
+    normalizer = text_normalizer(gender='F', case='G', separators='')
+
+    assert normalizer.normalize('из 21 книги') == 'из двадцати одной книги'
+    assert normalizer.normalize('2 000') == 'двух 000'
+
+
+@pytest.mark.parametrize('processes', [None, 2])
+def test_normalize_file(processes: int | None) -> None:
+    """Test the file is normalized in the order of lines."""
+    source = io.StringIO(''.join(f'строка {n}\n' for n in range(3_000)))
+    target = io.StringIO()
+
+    text_normalizer().normalize_file(source, target, processes)
+    lines = target.getvalue().splitlines()
+
+    assert len(lines) == 3_000
+    assert lines[2_999] == 'строка две тысячи девятьсот девяносто девять'
+
+
+def test_normalizer_flag_validation() -> None:
+    """Test the unexpected flag."""
+    with pytest.raises(KeyError):
+        text_normalizer(gender='X')  # type: ignore[arg-type]
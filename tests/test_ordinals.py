@@ -0,0 +1,77 @@
+"""Test number conversion to Russian ordinal numerals."""
+
+import pytest
+
+from src.number_converter import convert_ordinal
+from src.number_converter.types import CaseType, GenderType
+
+UNITS = [
+    (0, 'M', 'N', 'нулевой'),
+    (1, 'M', 'N', 'первый'),
+    (1, 'F', 'G', 'первой'),
+    (2, 'M', 'N', 'второй'),
+    (2, 'N', 'A', 'второе'),
+    (3, 'M', 'N', 'третий'),
+    (3, 'F', 'A', 'третью'),
+    (3, 'N', 'G', 'третьего'),
+    (3, 'M', 'P', 'третьем'),
+    (7, 'F', 'I', 'седьмой'),
+    (11, 'M', 'D', 'одиннадцатому'),
+    (40, 'M', 'N', 'сороковой'),
+    (90, 'F', 'N', 'девяностая'),
+    (100, 'M', 'N', 'сотый'),
+    (121, 'M', 'G', 'сто двадцать первого'),
+    (140, 'N', 'P', 'сто сороковом'),
+    (315, 'F', 'N', 'триста пятнадцатая'),
+    (800, 'M', 'I', 'восьмисотым'),
+]
+FACTORS = [
+    (1_000, 'M', 'N', 'тысячный'),
+    (2_000, 'N', 'P', 'двухтысячном'),
+    (5_000, 'F', 'N', 'пятитысячная'),
+    (11_000, 'M', 'N', 'одиннадцатитысячный'),
+    (21_000, 'M', 'N', 'двадцатиоднотысячный'),
+    (40_000, 'M', 'N', 'сорокатысячный'),
+    (90_000, 'M', 'N', 'девяностотысячный'),
+    (100_000, 'M', 'N', 'стотысячный'),
+    (150_000, 'M', 'N', 'стапятидесятитысячный'),
+    (200_000, 'M', 'N', 'двухсоттысячный'),
+    (1_000_000, 'M', 'N', 'миллионный'),
+    (3_000_000, 'M', 'G', 'трёхмиллионного'),
+    (1_000_000_000, 'M', 'N', 'миллиардный'),
+]
+COMPOUNDS = [
+    (2_021, 'M', 'N', 'две тысячи двадцать первый'),
+    (1_000_001, 'N', 'D', 'один миллион первому'),
+    (2_001_000, 'M', 'N', 'два миллиона тысячный'),
+    (
+        999_999_999_999,
+        'M',
+        'N',
+        'девятьсот девяносто девять миллиардов '
+        'девятьсот девяносто девять миллионов '
+        'девятьсот девяносто девять тысяч '
+        'девятьсот девяносто девятый',
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    'number, gender, case, numeral',
+    UNITS + FACTORS + COMPOUNDS,
+)
+def test_convert_ordinals(
+    number: int,
+    gender: GenderType,
+    case: CaseType,
+    numeral: str,
+) -> None:
+    """Test the convert to ordinal numerals."""
+    assert convert_ordinal(number, gender, case) == numeral
+
+
+@pytest.mark.parametrize('number', [-1, 10**12])
+def test_ordinal_number_validation(number: int) -> None:
+    """Test unexpected number value."""
+    with pytest.raises(ValueError):
+        convert_ordinal(number, 'M', 'N')
@@ -0,0 +1,68 @@
+"""Test number conversion to numerals in every gender and case."""
+
+import pytest
+
+from src.number_converter import (
+    convert_number,
+    factor_converter,
+    number_converter,
+    paradigm,
+    paradigm_many,
+)
+from src.number_converter.base import FactorConverterABC
+from src.number_converter.paradigm import paradigm_
+from src.number_converter.types import CASES, GENDERS, CaseType, Factor
+
+NUMBERS = [0, 1, 2, 5, 21, 1_000, 2_002, 154_323, 11_001_001_001]
+
+
+@pytest.mark.parametrize('number', NUMBERS)
+def test_paradigm_matches_conversion(number: int) -> None:
+    """Test the paradigm forms equal the separate conversions."""
+    forms = paradigm(number)
+
+    for case, case_name in CASES.items():
+        for gender, gender_name in GENDERS.items():
+            numeral = getattr(getattr(forms, case_name), gender_name)
+            assert numeral == convert_number(number, gender, case)
+
+
+def test_paradigm_deduplicate() -> None:
+    """Test the coinciding gender forms are collapsed."""
+    forms = paradigm(2_002, deduplicate=True)
+
+    assert forms.nominative == (
+        'две тысячи два',
+        'две тысячи две',
+        'две тысячи два',
+    )
+    assert forms.genitive == 'двух тысяч двух'
+    assert paradigm(5, deduplicate=True).instrumental == 'пятью'
+
+
+def test_paradigm_many() -> None:
+    """Test the batch conversion keeps the order of numbers."""
+    assert paradigm_many(NUMBERS) == [paradigm(number) for number in NUMBERS]
+
+
+class TextFactorConverter(FactorConverterABC):
+    """The factor converter implementing the text conversion only."""
+
+    def get_text(self, number: int, case: CaseType, factor: Factor) -> str:
+        """Get the number factor numeral."""
+        return factor_converter.get_text(number, case, factor)
+
+
+@pytest.mark.parametrize('number', NUMBERS)
+def test_paradigm_default_cases(number: int) -> None:
+    """Test the factor converter without own case declension."""
+    forms = paradigm_(number, number_converter, TextFactorConverter())
+
+    assert forms == paradigm(number)
+
+
+@pytest.mark.parametrize('number', [-1, 10**12])
+def test_paradigm_number_validation(number: int) -> None:
+    """Test unexpected number value."""
+    with pytest.raises(ValueError):
+        paradigm(number)
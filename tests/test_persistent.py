@@ -0,0 +1,113 @@
+"""Testing the persistent cache of numerals."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.number_converter import (
+    convert_number,
+    factor_converter,
+    load_ru_tables,
+    persistent_cache,
+)
+from src.number_converter.converters import TableNumberConverter
+from src.number_converter.persistent import PersistentCache, main
+
+
+def test_persistent_cache_shared(tmp_path: Path) -> None:
+    """Test the numerals are shared between connections."""
+    path = tmp_path / 'numerals.db'
+    numbers = [5, 1_021, 5, 999_999_999_999]
+
+    with persistent_cache(path) as writer, persistent_cache(path) as reader:
+        numerals = writer.convert_many(numbers, 'F', 'G')
+
+        assert numerals == [convert_number(n, 'F', 'G') for n in numbers]
+        assert len(reader) == 3
+        assert reader.convert(1_021, 'F', 'G') == numerals[1]
+
+
+def test_persistent_cache_eviction() -> None:
+    """Test the oldest numerals are evicted over the size."""
+    with persistent_cache(':memory:', max_size=10) as cache:
+        cache.convert_many(range(25), 'M', 'N')
+
+        assert len(cache) == 10
+        assert cache.convert(0, 'M', 'N') == 'ноль'
+
+
+def test_persistent_cache_recently_used() -> None:
+    """Test the requested numerals are not evicted."""
+    with persistent_cache(':memory:', max_size=10) as cache:
+        cache.warm(range(5), ['M'], ['N'])
+
+        for number in range(100, 120):
+            cache.convert_many([*range(5), number], 'M', 'N')
+
+        assert len(cache) == 10
+        assert cache._read(set(range(5)), 'MN').keys() == set(range(5))
+
+
+def test_persistent_cache_hit_without_lock(tmp_path: Path) -> None:
+    """Test the hits are read while another process writes."""
+    path = tmp_path / 'numerals.db'
+
+    with persistent_cache(path) as cache:
+        cache.convert(5, 'M', 'N')
+
+        writer = sqlite3.connect(path)
+        writer.execute('BEGIN IMMEDIATE')
+        try:
+            assert cache.convert(5, 'M', 'N') == 'пять'
+        finally:
+            writer.rollback()
+            writer.close()
+
+
+def test_persistent_cache_fingerprint(tmp_path: Path) -> None:
+    """Test the numerals of other converters are removed."""
+    path = tmp_path / 'numerals.db'
+    tables = load_ru_tables()
+    number_converter = TableNumberConverter(
+        tables._replace(zero=('нуль',) * len(tables.zero))
+    )
+
+    with persistent_cache(path) as cache:
+        cache.convert_many([0, 1], 'M', 'N')
+
+    with persistent_cache(path) as cache:
+        assert len(cache) == 2
+
+    with PersistentCache(path, number_converter, factor_converter) as cache:
+        assert len(cache) == 0
+        assert cache.convert(0, 'M', 'N') == 'нуль'
+
+    with persistent_cache(path) as cache:
+        assert len(cache) == 0
+        assert cache.convert(0, 'M', 'N') == 'ноль'
+
+
+def test_persistent_cache_warm(tmp_path: Path) -> None:
+    """Test the cache is populated from the input file."""
+    path = tmp_path / 'numerals.db'
+    inputs = tmp_path / 'inputs.txt'
+    inputs.write_text('1\n\n2\n1\n', 'utf-8')
+
+    assert main([str(path), str(inputs), '-g', 'F', '-c', 'N', '-c', 'G']) == 0
+
+    with persistent_cache(path) as cache:
+        assert len(cache) == 4
+
+
+def test_persistent_cache_validation() -> None:
+    """Test unexpected flags and number value."""
+    with persistent_cache(':memory:') as cache:
+        with pytest.raises(KeyError):
+            cache.convert(1, 'X', 'N')  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            cache.convert(-1, 'M', 'N')
+        with pytest.raises(ValueError):
+            cache.convert(10**20, 'M', 'N')
+        with pytest.raises(TypeError):
+            cache.convert('1', 'M', 'N')  # type: ignore[arg-type]
@@ -0,0 +1,150 @@
+"""Testing the asynchronous streaming conversion."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+import pytest
+
+from src.number_converter import aconvert_stream, convert_number
+from src.number_converter.stream import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_PENDING,
+)
+
+NUMBERS = list(range(0, 100_000, 7))
+
+
+async def generate(numbers: list[int]) -> AsyncIterator[int]:
+    """Yield the numbers asynchronously."""
+    for number in numbers:
+        yield number
+
+
+async def collect(
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    executor: Executor | None = None,
+) -> list[str]:
+    """Collect the numerals of the stream."""
+    stream = aconvert_stream(
+        generate(NUMBERS),
+        'F',
+        'G',
+        chunk_size=chunk_size,
+        max_pending=max_pending,
+        executor=executor,
+    )
+    return [numeral async for numeral in stream]
+
+
+@pytest.mark.parametrize(
+    'chunk_size, max_pending',
+    [(1, 1), (100, 2), (10**6, 4)],
+)
+def test_stream_order(chunk_size: int, max_pending: int) -> None:
+    """Test the numerals are yielded in the order of input."""
+    numerals = asyncio.run(
+        collect(chunk_size=chunk_size, max_pending=max_pending)
+    )
+
+    assert numerals == [convert_number(n, 'F', 'G') for n in NUMBERS]
+
+
+def test_stream_process_executor() -> None:
+    """Test the conversion in the process executor."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        numerals = asyncio.run(collect(chunk_size=500, executor=executor))
+
+    assert numerals == [convert_number(n, 'F', 'G') for n in NUMBERS]
+
+
+def test_stream_chunk_validation() -> None:
+    """Test unexpected chunk size."""
+    with pytest.raises(ValueError):
+        asyncio.run(collect(chunk_size=0))
+
+
+def test_stream_number_validation() -> None:
+    """Test unexpected number value in the stream."""
+
+    async def convert() -> list[str]:
+        stream = aconvert_stream(generate([1, -1]), 'M', 'N')
+        return [numeral async for numeral in stream]
+
+    with pytest.raises(ValueError):
+        asyncio.run(convert())
+
+
+def test_stream_paused_source() -> None:
+    """Test the converted chunks are yielded while the source waits."""
+
+    async def convert() -> list[str]:
+        resume = asyncio.Event()
+
+        async def paused() -> AsyncIterator[int]:
+            for number in (1, 2, 3):
+                yield number
+            await resume.wait()
+            yield 4
+
+        stream = aconvert_stream(paused(), 'M', 'N', chunk_size=1)
+        numerals = [await anext(stream) for _ in range(3)]
+        resume.set()
+        numerals.extend([numeral async for numeral in stream])
+        return numerals
+
+    numerals = asyncio.run(asyncio.wait_for(convert(), timeout=5))
+
+    assert numerals == ['один', 'два', 'три', 'четыре']
+
+
+def test_stream_paused_source_partial_chunk() -> None:
+    """Test the partial chunk is yielded while the source waits."""
+
+    async def convert() -> list[str]:
+        resume = asyncio.Event()
+
+        async def paused() -> AsyncIterator[int]:
+            yield 1
+            yield 2
+            await resume.wait()
+            yield 3
+
+        stream = aconvert_stream(paused(), 'M', 'N')
+        numerals = [
+            await asyncio.wait_for(anext(stream), timeout=1) for _ in range(2)
+        ]
+        resume.set()
+        numerals.extend([numeral async for numeral in stream])
+        return numerals
+
+    numerals = asyncio.run(asyncio.wait_for(convert(), timeout=5))
+
+    assert numerals == ['один', 'два', 'три']
+
+
+def test_stream_delay_validation() -> None:
+    """Test unexpected maximum delay."""
+
+    async def convert() -> list[str]:
+        stream = aconvert_stream(generate([1]), 'M', 'N', max_delay=-1)
+        return [numeral async for numeral in stream]
+
+    with pytest.raises(ValueError):
+        asyncio.run(convert())
+
+
+def test_stream_source_error() -> None:
+    """Test the error of the source is raised."""
+
+    async def convert() -> list[str]:
+        async def broken() -> AsyncIterator[int]:
+            yield 1
+            raise RuntimeError('source failed')
+
+        stream = aconvert_stream(broken(), 'M', 'N', chunk_size=1)
+        return [numeral async for numeral in stream]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(asyncio.wait_for(convert(), timeout=5))
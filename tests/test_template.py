@@ -0,0 +1,78 @@
+"""Test rendering of templates with numbers in words."""
+
+import pytest
+
+from src.number_converter import convert_many, formatter, render, render_many
+
+TEMPLATES = [
+    ('{amount:words}', {'amount': 21}, 'двадцать один'),
+    ('{amount:words:F}', {'amount': 21}, 'двадцать одна'),
+    ('{amount:words:F:G} руб.', {'amount': 2}, 'двух руб.'),
+    ('{n} ({n:words:N:A})', {'n': 1}, '1 (одно)'),
+    ('{n:>{width}}', {'n': 7, 'width': 3}, '  7'),
+    ('{n:words:{g}}', {'n': 1, 'g': 'F'}, 'одна'),
+]
+
+
+@pytest.mark.parametrize('template, fields, text', TEMPLATES)
+def test_render(template: str, fields: dict[str, int], text: str) -> None:
+    """Test the compiled template rendering."""
+    assert render(template, **fields) == text
+    assert formatter.format(template, **fields) == text
+
+
+def test_render_positional() -> None:
+    """Test the automatic field numbering."""
+    assert render('{:words} и {:words:F:I}', 3, 1) == 'три и одной'
+
+
+@pytest.mark.parametrize(
+    'template, args, text',
+    [
+        ('{:>{}} {:words}', (7, 3, 2), '  7 два'),
+        ('{:>{}}|{:words}', ('a', 5, 3), '    a|три'),
+    ],
+)
+def test_render_positional_nested(
+    template: str, args: tuple[object, ...], text: str
+) -> None:
+    """Test the automatic numbering of nested specification fields."""
+    assert render(template, *args) == text
+    assert formatter.format(template, *args) == text
+
+
+def test_render_many_dynamic_numeral() -> None:
+    """Test the numeral specification resolved per row."""
+    rows = [{'n': 1, 'g': 'F'}, {'n': 1, 'g': 'N'}, {'n': 2, 'g': 'M'}]
+
+    assert render_many('{n:words:{g}}', rows) == ['одна', 'одно', 'два']
+
+
+def test_render_many() -> None:
+    """Test the batch rendering keeps the order of rows."""
+    rows = [{'n': 1, 'm': 5}, {'n': 2, 'm': 5}, {'n': 1, 'm': 1_000}]
+    texts = render_many('{n:words:F} из {m:words:M:G}', rows)
+
+    assert texts == [
+        'одна из пяти',
+        'две из пяти',
+        'одна из одной тысячи',
+    ]
+
+
+def test_convert_many() -> None:
+    """Test the batch conversion with repeated numbers."""
+    assert convert_many([2, 1, 2], 'F', 'N') == ['две', 'одна', 'две']
+
+
+@pytest.mark.parametrize('template', ['{n:words:X}', '{n:words:M:Z}'])
+def test_numeral_spec_validation(template: str) -> None:
+    """Test the unexpected numeral flags."""
+    with pytest.raises(ValueError):
+        render(template, n=1)
+
+
+def test_render_numbering_validation() -> None:
+    """Test the automatic and manual numbering mix."""
+    with pytest.raises(ValueError):
+        render('{} {0}', 1)